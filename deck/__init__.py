@@ -0,0 +1 @@
+"""Helpers for building, caching and exporting the presentation."""
@@ -0,0 +1,73 @@
+"""
+Animations tuned for full-scene transitions.
+
+``self.play(FadeOut(a), FadeOut(b), ...)`` creates one animation per mobject, and each of them
+deep copies its mobject and interpolates every submobject of it on every frame.
+:class:`BatchedFadeOut` instead gathers the colors of the whole family into one array once, so
+a frame of the fade is a single vectorized multiplication (plus one per image).
+"""
+
+import numpy as np
+from manim import Animation, Group, ImageMobject, Mobject, PMobject, Scene, VMobject
+
+# Color arrays of a VMobject, all of them with the opacity in their last column
+RGBA_ATTRIBUTES = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+# Color array of a point cloud (e.g. deck.scatter), one row per point
+POINT_RGBA_ATTRIBUTES = ("rgbas",)
+
+
+def rgba_attributes(mobject: Mobject) -> tuple[str, ...]:
+    """Return the names of the color arrays of ``mobject``."""
+    if isinstance(mobject, VMobject):
+        return RGBA_ATTRIBUTES
+    if isinstance(mobject, PMobject):
+        return POINT_RGBA_ATTRIBUTES
+    return ()
+
+
+class BatchedFadeOut(Animation):
+    """Fade ``mobjects`` out together and remove them from the scene."""
+
+    def __init__(self, *mobjects: Mobject, **kwargs: object) -> None:
+        """Create the fade out of ``mobjects``, with the keyword arguments of :class:`~manim.Animation`."""
+        super().__init__(Group(*mobjects), remover=True, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        """Skip the copy of the family, the starting opacities are kept by :meth:`begin`."""
+        return self.mobject
+
+    def begin(self) -> None:
+        """Replace the color arrays of the family with views into one shared array."""
+        family = self.mobject.get_family()
+        self._arrays = [
+            (mobject, name, getattr(mobject, name)) for mobject in family for name in rgba_attributes(mobject)
+        ]
+        self._rgbas = np.concatenate([array for _, _, array in self._arrays]) if self._arrays else np.zeros((0, 4))
+        self._opacities = self._rgbas[:, 3].copy()
+        offset = 0
+        for mobject, name, array in self._arrays:
+            setattr(mobject, name, self._rgbas[offset : offset + len(array)])
+            offset += len(array)
+
+        # Pixel arrays may be shared between images (see deck.assets), so fade a private copy
+        self._images = [
+            (image, image.pixel_array, image.pixel_array.copy()) for image in family if isinstance(image, ImageMobject)
+        ]
+        for image, _, faded in self._images:
+            image.pixel_array = faded
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        """Scale all opacities of the family at once."""
+        opacity = 1 - self.rate_func(alpha)
+        self._rgbas[:, 3] = self._opacities * opacity
+        for _, pixels, faded in self._images:
+            faded[..., 3] = pixels[..., 3] * opacity
+
+    def clean_up_from_scene(self, scene: Scene) -> None:
+        """Remove the mobjects and give them back their original colors."""
+        super().clean_up_from_scene(scene)
+        for mobject, name, array in self._arrays:
+            setattr(mobject, name, array)
+        for image, pixels, _ in self._images:
+            image.pixel_array = pixels
@@ -0,0 +1,87 @@
+"""
+Shared, decode-once raster assets.
+
+Every :class:`SharedImage` of the same file points at one read-only RGBA array. The array is
+decoded once per file content and stored as a raw ``.npy`` file in manim's media directory, so
+later runs (and the parallel render workers) memory-map it instead of decoding the PNG again.
+"""
+
+import copy
+import functools
+import hashlib
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import DEFAULT_QUALITY, QUALITIES, ImageMobject, config
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.utils.images import get_full_raster_image_path
+from PIL import Image
+
+
+@functools.cache
+def load_pixels(file_name: str | Path) -> np.ndarray:
+    """Return the read-only RGBA pixel array of ``file_name``, decoding it at most once."""
+    path = get_full_raster_image_path(file_name)
+    data = path.read_bytes()
+    cache_file = config.get_dir("media_dir") / "images" / f"{hashlib.sha256(data).hexdigest()}.npy"
+    if not cache_file.exists():
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with Image.open(path) as image:
+            pixels = np.asarray(image.convert("RGBA"))
+        # Workers may decode the same file concurrently: write aside and rename, so that
+        # nobody maps a partially written array
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, suffix=".tmp", delete=False) as stream:
+            np.save(stream, pixels)
+        Path(stream.name).replace(cache_file)
+    return np.load(cache_file, mmap_mode="r")
+
+
+class SharedImage(ImageMobject):
+    """
+    :class:`~manim.ImageMobject` backed by the shared pixel array of its file.
+
+    Copies (including the ones made by animations) keep pointing at the same array.
+    Methods changing pixels in place first give the mobject a private copy.
+    """
+
+    def __init__(
+        self,
+        file_name: str | Path,
+        scale_to_resolution: int = QUALITIES[DEFAULT_QUALITY]["pixel_height"],
+        **kwargs: object,
+    ) -> None:
+        """Create an image of ``file_name`` without copying its pixels."""
+        # Same attributes as ImageMobject.__init__, which would copy the array
+        self.fill_opacity = 1
+        self.stroke_opacity = 1
+        self.invert = False
+        self.image_mode = "RGBA"
+        self.pixel_array = load_pixels(file_name)
+        self.pixel_array_dtype = "uint8"
+        self.path = get_full_raster_image_path(file_name)
+        AbstractImageMobject.__init__(self, scale_to_resolution, **kwargs)
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "SharedImage":
+        """Copy the mobject, but not its shared pixels."""
+        if not self.pixel_array.flags.writeable:
+            memo[id(self.pixel_array)] = self.pixel_array
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        for key, value in self.__dict__.items():
+            setattr(result, key, copy.deepcopy(value, memo))
+        return result
+
+    def _own_pixels(self) -> None:
+        if not self.pixel_array.flags.writeable:
+            self.pixel_array = np.array(self.pixel_array)
+
+    def set_color(self, *args: object, **kwargs: object) -> "SharedImage":
+        """Set the color of all pixels, on a private copy of the pixels."""
+        self._own_pixels()
+        return super().set_color(*args, **kwargs)
+
+    def set_opacity(self, alpha: float) -> "SharedImage":
+        """Set the opacity of all pixels, on a private copy of the pixels."""
+        self._own_pixels()
+        return super().set_opacity(alpha)
@@ -0,0 +1,175 @@
+"""
+Per-slide render benchmarks with a regression report.
+
+Usage: ``python -m deck.bench [--profile NAME ...] [--scene NAME ...] [--threshold 0.1]``
+
+Every segment of every localized scene is rendered from scratch in a fresh process with manim's cache
+disabled. The run records the time spent building the scene, rasterizing frames, encoding
+them with ffmpeg and concatenating the slides, the number of frames (and how many of them
+were reused without rasterizing, see :mod:`deck.renderer`) and the peak RSS. Results
+are appended to a JSON history, and compared with the previous run of the same profile.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import wraps
+from importlib.metadata import version
+from pathlib import Path
+
+from manim import config
+
+from deck.profiles import Profile, ProfileFileWriter, apply_profile, get_profile
+from deck.renderer import DedupRenderer
+from deck.segments import load_scene
+
+HISTORY_FILE = Path("bench/history.json")
+DECK = Path("main.py")
+SCENE_NAMES = ("Presentation", "EnglishPresentation")
+# Metrics compared between runs, all of them being "lower is better"
+METRICS = ("build_s", "raster_s", "encode_s", "slides_s", "total_s", "peak_rss_mb")
+
+
+def _timed(function: Callable, totals: dict[str, float], calls: dict[str, int], key: str) -> Callable:
+    @wraps(function)
+    def wrapper(*args: object, **kwargs: object) -> object:
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            totals[key] += time.perf_counter() - start
+            calls[key] += 1
+
+    return wrapper
+
+
+def bench_segment(scene_name: str, segment: str | None, profile: Profile) -> dict[str, float]:
+    """Render ``segment`` of ``scene_name`` (the whole scene if ``None``) and return its metrics."""
+    apply_profile(profile)
+    config.disable_caching = True
+    config.progress_bar = "none"
+    output = Path(tempfile.mkdtemp(prefix="deck-bench-"))
+    config.media_dir = str(output / "media")
+
+    scene_cls = load_scene(DECK, scene_name)
+    if segment is not None:
+        scene_cls = type(f"{segment}_bench", (scene_cls,), {"segments": (segment,)})
+    renderer = DedupRenderer(file_writer_class=ProfileFileWriter, camera_class=scene_cls.camera_class)
+    scene = scene_cls(renderer=renderer, output_folder=output / "slides")
+
+    totals = dict.fromkeys(("play", "write_frame", "end_animation", "slides"), 0.0)
+    calls = dict.fromkeys(totals, 0)
+    file_writer = renderer.file_writer
+    renderer.play = _timed(renderer.play, totals, calls, "play")
+    file_writer.write_frame = _timed(file_writer.write_frame, totals, calls, "write_frame")
+    file_writer.end_animation = _timed(file_writer.end_animation, totals, calls, "end_animation")
+    scene._save_slides = _timed(scene._save_slides, totals, calls, "slides")  # noqa: SLF001
+
+    try:
+        start = time.perf_counter()
+        scene.render()
+        total = time.perf_counter() - start
+    finally:
+        shutil.rmtree(output, ignore_errors=True)
+
+    # Writing a frame blocks on ffmpeg's pipe, closing the pipe waits for ffmpeg to finish
+    encode = totals["write_frame"] + totals["end_animation"]
+    return {
+        "build_s": total - totals["play"] - totals["slides"],
+        "raster_s": totals["play"] - encode,
+        "encode_s": encode,
+        "slides_s": totals["slides"],
+        "total_s": total,
+        "frames": calls["write_frame"],
+        "reused_frames": renderer.reused_frames,
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _bench_task(task: tuple[str, str | None, Profile]) -> dict[str, float]:
+    return bench_segment(*task)
+
+
+def run(scene_names: list[str], profiles: list[Profile]) -> dict[str, dict[str, dict[str, float]]]:
+    """Benchmark every segment of ``scene_names`` with each of ``profiles``, by profile and slide."""
+    tasks = []
+    for profile in profiles:
+        for scene_name in scene_names:
+            segments = getattr(load_scene(DECK, scene_name), "segments", None) or [None]
+            tasks.extend((scene_name, segment, profile) for segment in segments)
+
+    results: dict[str, dict[str, dict[str, float]]] = {profile.name: {} for profile in profiles}
+    # One fresh process per slide, so peak RSS and caches are not shared between slides
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        for (scene_name, segment, profile), metrics in zip(tasks, pool.imap(_bench_task, tasks), strict=True):
+            results[profile.name][f"{scene_name}:{segment or 'construct'}"] = metrics
+    return results
+
+
+def regressions(history: list[dict], threshold: float) -> list[str]:
+    """Compare the last run of ``history`` with the previous one of each profile."""
+    *previous_runs, latest = history
+    report = []
+    for profile, slides in latest["results"].items():
+        previous = next((run["results"][profile] for run in reversed(previous_runs) if profile in run["results"]), {})
+        for slide, metrics in slides.items():
+            for metric in METRICS:
+                before, after = previous.get(slide, {}).get(metric), metrics[metric]
+                if before and after > before * (1 + threshold):
+                    report.append(
+                        f"[{profile}] {slide}: {metric} {before:.2f} -> {after:.2f} (+{after / before - 1:.0%})",
+                    )
+    return report
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile", action="append", help="Render profile to benchmark (default: draft).")
+    parser.add_argument(
+        "--scene",
+        action="append",
+        help=f"Scene of {DECK} to benchmark (default: {', '.join(SCENE_NAMES)}).",
+    )
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE, help="JSON history to append results to.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown reported as a regression.")
+    args = parser.parse_args()
+
+    profiles = [get_profile(name) for name in args.profile or ["draft"]]
+    history = json.loads(args.history.read_text()) if args.history.exists() else []
+    history.append(
+        {
+            "date": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "manim": version("manim"),
+            "manim-slides": version("manim-slides"),
+            "results": run(args.scene or list(SCENE_NAMES), profiles),
+        },
+    )
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    args.history.write_text(json.dumps(history, indent=2))
+
+    for profile, slides in history[-1]["results"].items():
+        for slide, metrics in sorted(slides.items(), key=lambda item: -item[1]["total_s"]):
+            sys.stdout.write(
+                f"[{profile}] {slide:45} total {metrics['total_s']:7.2f}s  build {metrics['build_s']:6.2f}s  "
+                f"raster {metrics['raster_s']:6.2f}s  encode {metrics['encode_s']:6.2f}s  "
+                f"frames {metrics['frames']:5d} ({metrics.get('reused_frames', 0):5d} reused)  "
+                f"rss {metrics['peak_rss_mb']:7.1f}MB\n",
+            )
+    if report := regressions(history, args.threshold):
+        sys.stdout.write("Regressions:\n" + "".join(f"  {line}\n" for line in report))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
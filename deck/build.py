@@ -0,0 +1,293 @@
+"""
+Incremental build of the published presentation.
+
+Usage: ``python -m deck.build [--profile NAME] [--locale LOCALE] [--jobs [N]] [--bundle FILE] [STAGE ...]``
+
+Every stage declares its input files and its outputs. A stage only runs when the content of its
+inputs or its parameters changed since its last successful run, or when an output is missing.
+Digests are compared instead of modification times, so fresh checkouts (e.g. in CI) skip work
+as well, provided they restore ``.build/``, ``media/`` and ``slides/`` (e.g. from the CI cache),
+which are not under version control. The stages after ``convert`` rewrite the HTML file in
+place, so their state is recorded once the last of them is done. The interactive player is only
+started with ``--present``. Each locale is built into its own HTML file, reusing the rendered
+segments it shares with the other locales. With ``--bundle``, the presentation is also packed
+into an archive or a single HTML file that works without network access.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from manim import logger
+
+from deck.encode import encode_presentation, load_encoder_settings
+from deck.export import bundle, dedupe_assets, export_stills, prune_assets, streaming_export, vendor_assets
+from deck.profiles import get_profile
+from deck.render import render
+
+STATE_FILE = Path(".build/state.json")
+SCENE_FILE = Path("main.py")
+# Scene of each locale, the first one being published as HTML_FILE
+LOCALE_SCENES = {"de": "Presentation", "en": "EnglishPresentation"}
+HTML_FILE = Path("presentation.html")
+
+
+@dataclass(frozen=True)
+class BuildOptions:
+    profile: str
+    jobs: int
+    locale: str = next(iter(LOCALE_SCENES))
+    bundle: Path | None = None
+
+    @property
+    def scene_name(self) -> str:
+        """Presentation scene of the selected locale."""
+        return LOCALE_SCENES[self.locale]
+
+    @property
+    def folder(self) -> Path:
+        """Slides folder of the selected profile."""
+        return get_profile(self.profile).folder
+
+    @property
+    def slides_file(self) -> Path:
+        """Presentation configuration written by the render stage."""
+        return self.folder / f"{self.scene_name}.json"
+
+    @property
+    def encoded_slides_file(self) -> Path:
+        """Presentation configuration with the delivery encoded videos, written by the encode stage."""
+        return self.folder / f"{self.scene_name}_encoded.json"
+
+    @property
+    def html_file(self) -> Path:
+        """HTML presentation of the selected locale."""
+        if self.locale == next(iter(LOCALE_SCENES)):
+            return HTML_FILE
+        return HTML_FILE.with_stem(f"{HTML_FILE.stem}_{self.locale}")
+
+    @property
+    def assets_dir(self) -> Path:
+        """Folder of the videos written next to the HTML presentation by manim-slides."""
+        return self.html_file.with_name(f"{self.html_file.stem}_assets")
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    inputs: Callable[[BuildOptions], list[Path]]
+    outputs: Callable[[BuildOptions], list[Path]]
+    run: Callable[[BuildOptions], None]
+    # Whether the stage rewrites its inputs, like the HTML file after conversion
+    in_place: bool = False
+
+    def digest(self, options: BuildOptions) -> str:
+        """Hash the render profile, the locale and the content of the stage inputs."""
+        digest = hashlib.sha256(f"{options.profile}:{options.locale}".encode())
+        for file in sorted(self.inputs(options)):
+            digest.update(file.as_posix().encode())
+            digest.update(file.read_bytes())
+        return digest.hexdigest()
+
+
+def _render(options: BuildOptions) -> None:
+    render(SCENE_FILE, options.scene_name, jobs=options.jobs, profile=get_profile(options.profile))
+
+
+def _encode(options: BuildOptions) -> None:
+    settings = load_encoder_settings(options.profile)
+    if settings is None:
+        shutil.copyfile(options.slides_file, options.encoded_slides_file)
+    else:
+        encode_presentation(options.slides_file, options.encoded_slides_file, settings, get_profile(options.profile))
+
+
+def _convert(options: BuildOptions) -> None:
+    scene_name = options.encoded_slides_file.stem
+    _manim_slides("convert", "--folder", str(options.folder), scene_name, str(options.html_file))
+
+
+def _stills(options: BuildOptions) -> None:
+    profile = get_profile(options.profile)
+    export_stills(options.html_file, encoder_options=("-preset", profile.preset, "-crf", str(profile.crf)))
+
+
+def _prune(options: BuildOptions) -> None:
+    dedupe_assets(options.html_file)
+    prune_assets(options.html_file, options.assets_dir)
+
+
+def _stream(options: BuildOptions) -> None:
+    profile = get_profile(options.profile)
+    streaming_export(
+        options.html_file,
+        source_height=profile.pixel_height,
+        encoder_options=("-preset", profile.preset, "-crf", str(profile.crf)),
+    )
+
+
+def _vendor(options: BuildOptions) -> None:
+    vendor_assets(options.html_file, options.assets_dir)
+
+
+def _bundle(options: BuildOptions) -> None:
+    if options.bundle is not None:
+        bundle(options.html_file, options.bundle)
+
+
+def _manim_slides(*args: str) -> None:
+    subprocess.run([sys.executable, "-m", "manim_slides", *args], check=True)  # noqa: S603
+
+
+def _files(*patterns: str) -> list[Path]:
+    return [file for pattern in patterns for file in Path().glob(pattern) if file.is_file()]
+
+
+STAGES = (
+    Stage(
+        "render",
+        inputs=lambda _: _files(
+            str(SCENE_FILE),
+            "manim.cfg",
+            "slides.toml",
+            "deck/*.py",
+            "locales/*.toml",
+            "img/*",
+            "results/*",
+            "data/*.json",
+        ),
+        outputs=lambda options: [options.slides_file],
+        run=_render,
+    ),
+    Stage(
+        "encode",
+        inputs=lambda options: [options.slides_file, Path("manim.cfg")],
+        outputs=lambda options: [options.encoded_slides_file],
+        run=_encode,
+    ),
+    Stage(
+        "convert",
+        inputs=lambda options: [options.encoded_slides_file],
+        outputs=lambda options: [options.html_file],
+        run=_convert,
+    ),
+    Stage(
+        "stills",
+        inputs=lambda options: [options.html_file],
+        outputs=lambda _: [],
+        run=_stills,
+        in_place=True,
+    ),
+    Stage(
+        "prune",
+        inputs=lambda options: [options.html_file],
+        outputs=lambda _: [],
+        run=_prune,
+        in_place=True,
+    ),
+    Stage(
+        "stream",
+        inputs=lambda options: [options.html_file],
+        outputs=lambda _: [],
+        run=_stream,
+        in_place=True,
+    ),
+    Stage(
+        "vendor",
+        inputs=lambda options: [options.html_file],
+        outputs=lambda _: [],
+        run=_vendor,
+        in_place=True,
+    ),
+    Stage(
+        "bundle",
+        inputs=lambda options: [options.html_file],
+        outputs=lambda options: [options.bundle] if options.bundle else [],
+        run=_bundle,
+    ),
+)
+
+
+def build(options: BuildOptions, stages: list[str] | None = None, *, force: bool = False) -> None:
+    """Run the ``stages`` (all by default) whose inputs or outputs are out of date."""
+    state = json.loads(STATE_FILE.read_text()) if STATE_FILE.exists() else {}
+    rewriting = []
+    for stage in STAGES:
+        if stages and stage.name not in stages:
+            continue
+        key = f"{stage.name}[{options.profile}:{options.locale}]"
+        if stage.in_place:
+            rewriting.append((key, stage))
+        digest = stage.digest(options)
+        outputs_exist = all(output.exists() for output in stage.outputs(options))
+        if not force and state.get(key) == digest and outputs_exist:
+            logger.info("Stage %s is up to date", stage.name)
+            continue
+        logger.info("Running stage %s", stage.name)
+        stage.run(options)
+        # Inputs may be outputs of this very run (e.g. the HTML pruned in place)
+        _save_state(state, key, stage.digest(options))
+
+    # The in-place stages rewrite the same HTML file and running them again on the final file
+    # changes nothing, so they are all up to date with it
+    for key, stage in rewriting:
+        _save_state(state, key, stage.digest(options))
+
+
+def _save_state(state: dict[str, str], key: str, digest: str) -> None:
+    state[key] = digest
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    STATE_FILE.write_text(json.dumps(state, indent=2))
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "stages",
+        nargs="*",
+        metavar="STAGE",
+        help="Stages to run: render, encode, convert, stills, prune, stream, vendor, bundle (default: all).",
+    )
+    parser.add_argument("--profile", default="final", help="Render profile defined in manim.cfg (default: final).")
+    parser.add_argument(
+        "--locale",
+        choices=LOCALE_SCENES,
+        default=next(iter(LOCALE_SCENES)),
+        help="Language of the presentation (default: de).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=os.cpu_count(),
+        const=os.cpu_count(),
+        help="Number of segments rendered in parallel (default: the CPU count).",
+    )
+    parser.add_argument(
+        "--bundle",
+        type=Path,
+        help="Also pack the presentation for offline use, into a .zip archive or a single .html file.",
+    )
+    parser.add_argument("--force", action="store_true", help="Run the stages even if they are up to date.")
+    parser.add_argument("--present", action="store_true", help="Open the interactive player after the build.")
+    args = parser.parse_args()
+    if unknown := set(args.stages) - {stage.name for stage in STAGES}:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    options = BuildOptions(profile=args.profile, jobs=args.jobs, locale=args.locale, bundle=args.bundle)
+    build(options, args.stages, force=args.force)
+    if args.present:
+        _manim_slides("present", "--folder", str(options.folder), options.scene_name)
+
+
+if __name__ == "__main__":
+    main()
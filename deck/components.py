@@ -0,0 +1,96 @@
+"""Reusable mobjects shared by several slides."""
+
+from collections.abc import Collection, Mapping, Sequence
+
+import numpy as np
+from manim import GREEN, GREY, RED, WHITE, VGroup
+
+from deck.text import CachedText
+
+
+class ResultsTable(VGroup):
+    """
+    Table of per-coin scores, with one block of ``header`` columns per dataset split.
+
+    Every distinct string is shaped only once and copied for each further cell using it.
+    All cells are then placed in a single pass: column widths and row heights are reduced
+    over the whole table at once, and every cell is moved to its final position directly.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        scores: Mapping[str, float | str],
+        splits: Mapping[str, Sequence[str]],
+        scam: Collection[str],
+        *,
+        header: Sequence[str] = ("Coin", "Accuracy"),
+        text_size: float = 0.7,
+        row_buff: float = 0.2,
+        column_buff: float = 1,
+        split_buff: float = 2,
+        **kwargs: object,
+    ) -> None:
+        """
+        Build the table.
+
+        :param scores: Score of each coin, formatted with ``str``.
+        :param splits: Coins of each split, by split title (e.g. ``"Train Set"``).
+        :param scam: Coins drawn as scams (red), all others are drawn as non-scams (green).
+        """
+        super().__init__(**kwargs)
+        glyphs: dict[str, CachedText] = {}
+
+        def cell(string: str, color: str) -> CachedText:
+            if string not in glyphs:
+                glyphs[string] = CachedText(string).scale(text_size)
+            return glyphs[string].copy().set_color(color)
+
+        titles, cells, index = [], [], []
+        for split, (split_title, coins) in enumerate(splits.items()):
+            titles.append(cell(split_title, WHITE))
+            for column, name in enumerate(header):
+                cells.append(cell(name, GREY))
+                index.append((split, column, 0))
+            for row, coin in enumerate(coins, start=1):
+                color = RED if coin in scam else GREEN
+                cells.append(cell(coin, color))
+                index.append((split, 0, row))
+                cells.append(cell(str(scores[coin]), color))
+                index.append((split, 1, row))
+
+        split_of, column_of, row_of = np.array(index).T
+        sizes = np.array([(mob.width, mob.height) for mob in cells])
+        n_splits, n_columns, n_rows = len(splits), len(header), row_of.max() + 1
+
+        column_widths = np.zeros((n_splits, n_columns))
+        np.maximum.at(column_widths, (split_of, column_of), sizes[:, 0])
+        row_heights = np.zeros((n_splits, n_rows))
+        np.maximum.at(row_heights, (split_of, row_of), sizes[:, 1])
+        rows_per_split = np.zeros(n_splits)
+        np.maximum.at(rows_per_split, split_of, row_of + 1)
+        title_sizes = np.array([(mob.width, mob.height) for mob in titles])
+
+        # Horizontal layout: columns inside a split, splits next to each other
+        body_widths = column_widths.sum(axis=1) + column_buff * (n_columns - 1)
+        split_widths = np.maximum(body_widths, title_sizes[:, 0])
+        split_lefts = np.concatenate(([0], np.cumsum(split_widths + split_buff)[:-1]))
+        column_lefts = np.cumsum(column_widths + column_buff, axis=1) - column_widths - column_buff
+        column_centers = (split_lefts + (split_widths - body_widths) / 2)[:, None] + column_lefts + column_widths / 2
+
+        # Vertical layout: title above the rows, splits centered on each other
+        row_tops = np.cumsum(row_heights + row_buff, axis=1) - row_heights - row_buff
+        row_centers = -(title_sizes[:, 1, None] + row_buff + row_tops + row_heights / 2)
+        split_heights = title_sizes[:, 1] + row_buff + row_heights.sum(axis=1) + row_buff * (rows_per_split - 1)
+        split_offsets = (split_heights.max() - split_heights) / 2
+
+        targets = np.zeros((len(cells), 3))
+        targets[:, 0] = column_centers[split_of, column_of]
+        targets[:, 1] = row_centers[split_of, row_of] - split_offsets[split_of]
+        title_targets = np.zeros((n_splits, 3))
+        title_targets[:, 0] = split_lefts + split_widths / 2
+        title_targets[:, 1] = -title_sizes[:, 1] / 2 - split_offsets
+
+        for mob, target in zip(cells + titles, np.concatenate((targets, title_targets)), strict=True):
+            mob.move_to(target)
+        self.add(*titles, *cells)
+        self.center()
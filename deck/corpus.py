@@ -0,0 +1,245 @@
+"""
+Statistics of the scraped Reddit corpus, for data slides.
+
+Usage: ``python -m deck.corpus FILE [--output FILE] [--chunk-size N] [--{coin,time,depth}-field NAME]``
+
+``FILE`` is a local export of the scraped posts and comments: JSON lines with one document per
+line, or an Elasticsearch bulk file, whose action lines are skipped and whose hits may wrap
+documents in ``_source``. The export is streamed in chunks of ``--chunk-size`` documents, and
+every chunk is reduced with NumPy into counts per coin, per day and per thread depth, so memory
+stays bounded whatever the size of the export. The aggregate is written as a small JSON file,
+together with the size and modification time of the export and the names of the counted fields.
+It is only recomputed when the export or the fields change, and slides read the JSON file, so
+their digest (see :mod:`deck.segments`) never needs the export itself.
+"""
+
+import argparse
+import itertools
+import json
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+from manim import DOWN, GREY, ORANGE, RIGHT, UP, Axes, Rectangle, VGroup, logger
+
+from deck.series import decimate, series_graph
+from deck.text import CachedText
+
+STATS_FILE = Path("data/corpus_stats.json")
+# Action lines of an Elasticsearch bulk file, each followed by a document (except "delete")
+BULK_ACTIONS = {"index", "create", "update", "delete"}
+SECONDS_PER_DAY = 86400
+
+
+@dataclass(frozen=True)
+class CorpusStats:
+    # Export the statistics were computed from, with its size and modification time
+    source: str
+    size: int
+    mtime_ns: int
+    documents: int
+    per_coin: dict[str, int]
+    # Number of documents per ISO date
+    per_day: dict[str, int]
+    # Number of comments per thread depth, starting at 0 for top-level comments
+    per_depth: list[int]
+    # Document fields holding the coin, the date and the depth, by parameter of aggregate()
+    fields: dict[str, str] = field(default_factory=dict)
+
+    def save(self, file: Path) -> None:
+        """Write the statistics to ``file`` as JSON."""
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(json.dumps(asdict(self), indent=2, ensure_ascii=False))
+
+    @classmethod
+    def load(cls, file: str | Path) -> "CorpusStats":
+        """Read statistics written by :meth:`save`."""
+        return cls(**json.loads(Path(file).read_text(encoding="utf-8")))
+
+
+def iter_chunks(file: Path, chunk_size: int) -> Iterator[list[dict]]:
+    """Yield the documents of export ``file`` in lists of at most ``chunk_size``."""
+    with file.open(encoding="utf-8") as stream:
+        lines = (line for line in stream if line.strip())
+        while chunk := list(itertools.islice(lines, chunk_size)):
+            documents = []
+            for line in chunk:
+                document = json.loads(line)
+                if len(document) == 1 and next(iter(document)) in BULK_ACTIONS:
+                    continue
+                documents.append(document.get("_source", document))
+            yield documents
+
+
+def to_days(values: list) -> np.ndarray:
+    """Convert Unix timestamps and ISO date-times to ``datetime64[D]``, in no particular order."""
+    seconds = np.array([value for value in values if not isinstance(value, str)], dtype=float)
+    # Drop time zone designators, which NumPy does not parse
+    dates = np.array([value[:19] for value in values if isinstance(value, str)], dtype="datetime64[s]")
+    return np.concatenate(
+        ((seconds // SECONDS_PER_DAY).astype("int64").astype("datetime64[D]"), dates.astype("datetime64[D]")),
+    )
+
+
+def aggregate(
+    file: Path,
+    *,
+    coin_field: str = "coin",
+    time_field: str = "created_utc",
+    depth_field: str = "depth",
+    chunk_size: int = 10_000,
+) -> CorpusStats:
+    """Stream over export ``file`` and count its documents per coin, day and depth."""
+    per_coin: Counter[str] = Counter()
+    per_day: Counter[str] = Counter()
+    per_depth = np.zeros(0, dtype=np.int64)
+    documents = 0
+    for chunk in iter_chunks(file, chunk_size):
+        documents += len(chunk)
+        coins, counts = np.unique(
+            [str(document[coin_field]) for document in chunk if document.get(coin_field) is not None],
+            return_counts=True,
+        )
+        per_coin.update(dict(zip(coins.tolist(), counts.tolist(), strict=True)))
+        times = [document[time_field] for document in chunk if document.get(time_field) is not None]
+        if times:
+            days, counts = np.unique(to_days(times), return_counts=True)
+            per_day.update(dict(zip(map(str, days), counts.tolist(), strict=True)))
+        depths = np.bincount(
+            np.array(
+                [document[depth_field] for document in chunk if document.get(depth_field) is not None],
+                dtype=np.int64,
+            ),
+        )
+        size = max(len(per_depth), len(depths))
+        per_depth = np.pad(per_depth, (0, size - len(per_depth))) + np.pad(depths, (0, size - len(depths)))
+
+    stat = file.stat()
+    return CorpusStats(
+        source=file.as_posix(),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        documents=documents,
+        per_coin=dict(per_coin.most_common()),
+        per_day=dict(sorted(per_day.items())),
+        per_depth=per_depth.tolist(),
+        fields={"coin_field": coin_field, "time_field": time_field, "depth_field": depth_field},
+    )
+
+
+def corpus_stats(  # noqa: PLR0913
+    file: Path,
+    output: Path = STATS_FILE,
+    *,
+    coin_field: str = "coin",
+    time_field: str = "created_utc",
+    depth_field: str = "depth",
+    chunk_size: int = 10_000,
+) -> CorpusStats:
+    """
+    Return the statistics of export ``file`` (see :func:`aggregate`).
+
+    The export is only scanned again if it or the counted fields changed since ``output`` was written.
+    """
+    fields = {"coin_field": coin_field, "time_field": time_field, "depth_field": depth_field}
+    if output.exists():
+        stats = CorpusStats.load(output)
+        stat = file.stat()
+        unchanged = (stats.source, stats.size, stats.mtime_ns) == (file.as_posix(), stat.st_size, stat.st_mtime_ns)
+        if unchanged and stats.fields == fields:
+            logger.info("Corpus statistics of '%s' are up to date", file)
+            return stats
+    stats = aggregate(file, **fields, chunk_size=chunk_size)
+    stats.save(output)
+    logger.info("Aggregated %d documents of '%s' into '%s'", stats.documents, file, output)
+    return stats
+
+
+class CorpusChart(VGroup):
+    """
+    Overview of the corpus: documents per coin as bars, and activity per day as a line.
+
+    Days without any document count as zero, and the activity series is decimated to at most
+    ``max_points`` points (see :func:`deck.series.decimate`).
+    """
+
+    def __init__(
+        self,
+        stats: CorpusStats,
+        *,
+        max_coins: int = 11,
+        width: float = 12,
+        height: float = 4,
+        max_points: int = 500,
+        **kwargs: object,
+    ) -> None:
+        """Build the chart of ``stats``, showing the ``max_coins`` coins with the most documents."""
+        super().__init__(**kwargs)
+        coins = sorted(stats.per_coin, key=stats.per_coin.get, reverse=True)[:max_coins]
+        counts = np.array([stats.per_coin[coin] for coin in coins], dtype=float)
+        bar_width = width / 2 / max(len(coins), 1) * 0.6
+        bars = VGroup(
+            *(
+                Rectangle(width=bar_width, height=max(height * count / counts.max(), 0.01), fill_opacity=1)
+                .set_color(ORANGE)
+                .set_stroke(width=0)
+                for count in counts
+            ),
+        ).arrange(RIGHT, buff=bar_width * 2 / 3, aligned_edge=DOWN)
+        labels = VGroup(
+            *(
+                CachedText(coin).scale(0.3).rotate(np.pi / 4).next_to(bar, DOWN)
+                for coin, bar in zip(coins, bars, strict=True)
+            ),
+        )
+        totals = VGroup(
+            *(
+                CachedText(f"{int(count):,}").scale(0.25).next_to(bar, UP, buff=0.1)
+                for count, bar in zip(counts, bars, strict=True)
+            ),
+        )
+
+        days = np.array(list(stats.per_day), dtype="datetime64[D]")
+        activity = np.zeros(int((days.max() - days.min()).astype(int)) + 1 if len(days) else 1)
+        if len(days):
+            activity[(days - days.min()).astype(int)] = list(stats.per_day.values())
+        axes = Axes(
+            x_range=[0, len(activity) - 1 or 1, max((len(activity) - 1) // 10, 1)],
+            y_range=[0, max(activity.max(), 1), max(activity.max(), 1) / 5],
+            x_length=width / 2,
+            y_length=height,
+            tips=False,
+            axis_config={"color": GREY},
+        )
+        x, y = decimate(np.arange(len(activity)), activity, max_points)
+        graph = series_graph(axes, x, y, color=ORANGE)
+
+        self.add(VGroup(VGroup(bars, labels, totals), VGroup(axes, graph)).arrange(RIGHT, buff=1))
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file", type=Path, help="JSON lines or Elasticsearch bulk export of the scraped documents.")
+    parser.add_argument("--output", type=Path, default=STATS_FILE, help=f"Statistics file (default: {STATS_FILE}).")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Documents per chunk (default: 10000).")
+    parser.add_argument("--coin-field", default="coin", help="Field holding the coin (default: coin).")
+    parser.add_argument("--time-field", default="created_utc", help="Field holding the date (default: created_utc).")
+    parser.add_argument("--depth-field", default="depth", help="Field holding the thread depth (default: depth).")
+    args = parser.parse_args()
+    stats = corpus_stats(
+        args.file,
+        args.output,
+        coin_field=args.coin_field,
+        time_field=args.time_field,
+        depth_field=args.depth_field,
+        chunk_size=args.chunk_size,
+    )
+    for coin, count in stats.per_coin.items():
+        logger.info("%-20s %10d", coin, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Duration estimate and layout checks of a presentation, without rendering it.
+
+Usage: ``python -m deck.dryrun [--scene NAME] [--hold SECONDS] [--target MINUTES]``
+
+The scene's ``construct`` runs with a renderer that skips every frame: animations jump to
+their end, and nothing is rasterized or encoded. Along the way, the run time of every ``play``
+and ``wait`` is summed per slide segment, and the mobjects on screen after each animation are
+checked for texts running off the frame and for texts overlapping each other. The duration
+estimate adds ``--hold`` seconds of talking for every pause of the presentation.
+
+The command exits with status 1 when a layout problem is found, so it can run on every commit.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from manim import DL, UR, CairoRenderer, ImageMobject, Mobject, Scene, Text, tempconfig
+from manim.utils.family import extract_mobject_family_members
+from manim_slides import Slide
+
+from deck.segments import load_scene
+from deck.text import CachedText
+from deck.trace import slide_label
+
+DECK = Path("main.py")
+# Distance (in scene units) by which boxes may overlap or leave the frame, e.g. for glyph outlines
+TOLERANCE = 0.02
+# Nothing is rasterized, so the camera only needs the aspect ratio of the deck
+DRY_RUN_CONFIG = {
+    "dry_run": True,
+    "disable_caching": True,
+    "progress_bar": "none",
+    "pixel_width": 160,
+    "pixel_height": 90,
+}
+
+
+@dataclass
+class SegmentReport:
+    label: str
+    # Run time of the animations and waits, in seconds
+    duration: float = 0
+    # Number of times the presentation stops and waits for the speaker
+    pauses: int = 0
+    issues: list[str] = field(default_factory=list)
+
+
+def describe(mobject: Mobject) -> str:
+    """Return a short human readable name of ``mobject``."""
+    if isinstance(mobject, (Text, CachedText)):
+        text = mobject.text if len(mobject.text) <= 40 else f"{mobject.text[:37]}..."  # noqa: PLR2004
+        return repr(text)
+    return type(mobject).__name__
+
+
+def bounding_boxes(mobjects: list[Mobject]) -> np.ndarray:
+    """Return the ``(n, 2, 2)`` lower left and upper right corners of ``mobjects``, in the plane."""
+    corners = [[mobject.get_corner(DL)[:2], mobject.get_corner(UR)[:2]] for mobject in mobjects]
+    return np.array(corners).reshape(-1, 2, 2)
+
+
+def off_frame(boxes: np.ndarray, frame_width: float, frame_height: float) -> np.ndarray:
+    """Return the indices of the ``boxes`` that are not entirely inside the frame."""
+    half = np.array([frame_width, frame_height]) / 2 + TOLERANCE
+    return np.flatnonzero(((boxes[:, 0] < -half) | (boxes[:, 1] > half)).any(axis=1))
+
+
+def overlapping(boxes: np.ndarray) -> np.ndarray:
+    """Return the ``(i, j)`` index pairs (with ``i < j``) of the ``boxes`` that overlap."""
+    low = np.maximum(boxes[:, None, 0], boxes[None, :, 0])
+    high = np.minimum(boxes[:, None, 1], boxes[None, :, 1])
+    overlap = ((high - low) > TOLERANCE).all(axis=2)
+    return np.argwhere(np.triu(overlap, k=1))
+
+
+def layout_issues(scene: Scene) -> list[str]:
+    """Check the mobjects of ``scene`` for texts and images off the frame, and for overlapping texts."""
+    family = extract_mobject_family_members(scene.mobjects)
+    texts = [
+        mobject
+        for mobject in family
+        if isinstance(mobject, (Text, CachedText)) and mobject.family_members_with_points()
+    ]
+    images = [mobject for mobject in family if isinstance(mobject, ImageMobject)]
+    camera = scene.renderer.camera
+
+    issues = []
+    if texts or images:
+        placed = texts + images
+        issues.extend(
+            f"{describe(placed[index])} runs off the frame"
+            for index in off_frame(bounding_boxes(placed), camera.frame_width, camera.frame_height)
+        )
+    if texts:
+        issues.extend(
+            f"{describe(texts[first])} overlaps {describe(texts[second])}"
+            for first, second in overlapping(bounding_boxes(texts))
+        )
+    return issues
+
+
+class DryRunRenderer(CairoRenderer):
+    """Cairo renderer that skips every frame and reports the run time of each animation."""
+
+    def __init__(self, on_play: Callable[[Scene, float], None], **kwargs: object) -> None:
+        """Create the renderer, calling ``on_play`` with the scene and the run time after each animation."""
+        super().__init__(skip_animations=True, **kwargs)
+        self.on_play = on_play
+
+    def update_frame(self, *args: object, **kwargs: object) -> None:
+        """Skip rasterization."""
+
+    def get_frame(self) -> None:
+        """Return no frame, since none is drawn."""
+
+    def play(self, scene: Scene, *args: object, **kwargs: object) -> None:
+        """Play an animation without any frame and report it."""
+        super().play(scene, *args, **kwargs)
+        self.on_play(scene, scene.duration)
+
+
+def dry_run(scene_cls: type[Slide]) -> list[SegmentReport]:
+    """Run the ``construct`` of ``scene_cls`` without rendering, and report each of its segments."""
+    segment_names = getattr(scene_cls, "segments", None) or ["construct"]
+    reports = {name: SegmentReport(slide_label(scene_cls, name)) for name in segment_names}
+    current = [next(iter(reports.values()))]
+
+    def on_play(scene: Scene, duration: float) -> None:
+        current[0].duration += duration
+        current[0].issues.extend(issue for issue in layout_issues(scene) if issue not in current[0].issues)
+
+    with tempconfig(DRY_RUN_CONFIG):
+        scene = scene_cls(renderer=DryRunRenderer(on_play, camera_class=scene_cls.camera_class))
+        for name, report in reports.items():
+            if name == "construct":
+                continue
+            method = getattr(scene, name)
+
+            def reported(method: Callable = method, report: SegmentReport = report) -> None:
+                current[0] = report
+                method()
+
+            setattr(scene, name, reported)
+        next_slide = scene.next_slide
+
+        def counted(*args: object, **kwargs: object) -> None:
+            current[0].pauses += 1
+            next_slide(*args, **kwargs)
+
+        scene.next_slide = counted
+        scene.setup()
+        scene.construct()
+        # The presentation also stops on its last slide
+        current[0].pauses += 1
+    return list(reports.values())
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--file", type=Path, default=DECK, help="Python file defining the presentation.")
+    parser.add_argument(
+        "--scene",
+        default="Presentation",
+        help="Name of the presentation scene (default: Presentation).",
+    )
+    parser.add_argument(
+        "--hold",
+        type=float,
+        default=60,
+        help="Seconds spent talking at each pause, added to the estimate (default: 60).",
+    )
+    parser.add_argument("--target", type=float, default=15, help="Planned length of the talk in minutes (default: 15).")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    reports = dry_run(load_scene(args.file, args.scene))
+    for report in reports:
+        estimate = report.duration + args.hold * report.pauses
+        sys.stdout.write(
+            f"{report.label:45} animations {report.duration:6.1f}s  pauses {report.pauses:2d}  "
+            f"estimate {estimate / 60:5.1f}min\n",
+        )
+        sys.stdout.writelines(f"  layout: {issue}\n" for issue in report.issues)
+
+    duration = sum(report.duration for report in reports)
+    pauses = sum(report.pauses for report in reports)
+    estimate = (duration + args.hold * pauses) / 60
+    sys.stdout.write(
+        f"Total: {duration:.1f}s of animations, {pauses} pauses, estimated {estimate:.1f}min "
+        f"({estimate - args.target:+.1f}min against the {args.target:g}min target), "
+        f"checked in {time.perf_counter() - start:.2f}s\n",
+    )
+    if any(report.issues for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
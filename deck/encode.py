@@ -0,0 +1,141 @@
+"""
+Delivery encoding of the rendered slide videos.
+
+Manim encodes partial movies for editing speed, and the concatenated slides inherit those
+settings. Before conversion to HTML, every slide video is re-encoded with the ``[encode:<name>]``
+settings of ``manim.cfg`` for the active profile: codec, preset, CRF (or a bitrate with two
+passes) and a tune fitting mostly flat text on a plain background. Slides are separate videos
+that each start on a keyframe, so further keyframes are only spaced by ``keyframe_interval``.
+"""
+
+import configparser
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from manim import config, logger
+from manim_slides.config import PresentationConfig
+
+from deck.profiles import CONFIG_FILE, Profile
+
+SECTION_PREFIX = "encode:"
+
+
+@dataclass(frozen=True)
+class EncoderSettings:
+    codec: str = "libx264"
+    preset: str = "slow"
+    crf: int = 23
+    # E.g. "animation" or "stillimage" for x264 and x265
+    tune: str | None = None
+    # Target bitrate (e.g. "2M") encoded in two passes, instead of a constant quality
+    bitrate: str | None = None
+    # Maximum time between two keyframes, in seconds
+    keyframe_interval: float = 10
+
+    @property
+    def digest(self) -> str:
+        """Hash of the settings, part of the encoded file names."""
+        return hashlib.sha256(repr(sorted(asdict(self).items())).encode()).hexdigest()
+
+    def options(self, frame_rate: float) -> list[str]:
+        """Return the ffmpeg output options of these settings, except the two-pass ones."""
+        options = ["-vcodec", self.codec, "-preset", self.preset, "-pix_fmt", "yuv420p"]
+        options += ["-b:v", self.bitrate] if self.bitrate else ["-crf", str(self.crf)]
+        options += ["-tune", self.tune] if self.tune else []
+        options += ["-g", str(round(self.keyframe_interval * frame_rate))]
+        # Let browsers start playing before the whole file is downloaded
+        return [*options, "-movflags", "+faststart", "-an"]
+
+
+def load_encoder_settings(profile: str, file: Path = CONFIG_FILE) -> EncoderSettings | None:
+    """Read the ``[encode:<profile>]`` section of ``file``, if any."""
+    parser = configparser.ConfigParser()
+    parser.read(file)
+    section = f"{SECTION_PREFIX}{profile}"
+    if not parser.has_section(section):
+        return None
+    return EncoderSettings(
+        codec=parser.get(section, "codec", fallback=EncoderSettings.codec),
+        preset=parser.get(section, "preset", fallback=EncoderSettings.preset),
+        crf=parser.getint(section, "crf", fallback=EncoderSettings.crf),
+        tune=parser.get(section, "tune", fallback=None),
+        bitrate=parser.get(section, "bitrate", fallback=None),
+        keyframe_interval=parser.getfloat(section, "keyframe_interval", fallback=EncoderSettings.keyframe_interval),
+    )
+
+
+def encode_video(video: Path, dest: Path, settings: EncoderSettings, frame_rate: float) -> Path:
+    """Re-encode ``video`` into ``dest`` with ``settings``."""
+    command = [config.ffmpeg_executable, "-y", "-loglevel", "error", "-i", str(video)]
+    options = settings.options(frame_rate)
+    if settings.bitrate is None:
+        subprocess.run([*command, *options, str(dest)], check=True)  # noqa: S603
+        return dest
+    with tempfile.TemporaryDirectory() as folder:
+        log = str(Path(folder) / "pass")
+        subprocess.run(  # noqa: S603
+            [*command, *options, "-pass", "1", "-passlogfile", log, "-f", "mp4", os.devnull],
+            check=True,
+        )
+        subprocess.run([*command, *options, "-pass", "2", "-passlogfile", log, str(dest)], check=True)  # noqa: S603
+    return dest
+
+
+def encode_presentation(slides_file: Path, dest: Path, settings: EncoderSettings, profile: Profile) -> list[dict]:
+    """
+    Write ``dest``, a copy of presentation ``slides_file`` with re-encoded slide videos.
+
+    Videos already encoded with the same settings are reused, and a slide keeps its original
+    video when re-encoding does not make it smaller. Returns the size of each slide before and
+    after encoding.
+    """
+    presentation = PresentationConfig.from_file(slides_file)
+    folder = dest.parent / "files" / dest.stem
+    folder.mkdir(parents=True, exist_ok=True)
+
+    slides, report = [], []
+    for slide in presentation.slides:
+        encoded = folder / f"{slide.file.stem}_{settings.digest[:8]}{slide.file.suffix}"
+        if not encoded.exists():
+            # Encoded aside and renamed, so an interrupted or failed encode is never reused
+            with tempfile.NamedTemporaryFile(dir=folder, suffix=f".tmp{slide.file.suffix}", delete=False) as stream:
+                partial = Path(stream.name)
+            try:
+                encode_video(slide.file, partial, settings, profile.frame_rate)
+                if partial.stat().st_size >= slide.file.stat().st_size:
+                    shutil.copyfile(slide.file, partial)
+            except BaseException:
+                partial.unlink(missing_ok=True)
+                raise
+            partial.replace(encoded)
+        slides.append(slide.model_copy(update={"file": encoded}))
+        report.append({"slide": slide.file.name, "before": slide.file.stat().st_size, "after": encoded.stat().st_size})
+
+    PresentationConfig(
+        slides=slides,
+        resolution=presentation.resolution,
+        background_color=presentation.background_color,
+    ).to_file(dest)
+
+    for index, entry in enumerate(report, start=1):
+        logger.info(
+            "Slide %2d: %8.2f MB -> %8.2f MB (-%.0f%%)",
+            index,
+            entry["before"] / 1e6,
+            entry["after"] / 1e6,
+            100 * (1 - entry["after"] / entry["before"]),
+        )
+    before, after = sum(entry["before"] for entry in report), sum(entry["after"] for entry in report)
+    logger.info(
+        "Encoded %d slides: %.2f MB -> %.2f MB, %.2f MB saved",
+        len(report),
+        before / 1e6,
+        after / 1e6,
+        (before - after) / 1e6,
+    )
+    return report
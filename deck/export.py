@@ -0,0 +1,462 @@
+"""Post-processing of the HTML presentation written by ``manim-slides convert``."""
+
+import hashlib
+import json
+import posixpath
+import re
+import shutil
+import subprocess
+import tempfile
+import urllib.request
+import zipfile
+from pathlib import Path
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+from manim import config, logger
+from manim_slides.convert import file_to_data_uri
+from PIL import Image
+
+ASSET_REFERENCE = re.compile(r"""data-background-(?:video|image)=["']([^"']+)["']""")
+SECTION = re.compile(r"<section\b[^>]*>")
+VIDEO_REFERENCE = re.compile(r"""data-background-video=["']([^"']+)["']""")
+FREEZE_START = re.compile(r"freeze_start: ([\d.]+)")
+FREEZE_END = re.compile(r"freeze_end: ([\d.]+)")
+# Videos still from their first frame to their end (up to this time in seconds) are shown as images
+STILL_START = 0.1
+# Time kept after the last change of a video, so its clip ends on the still frame
+CLIP_MARGIN = 0.1
+
+
+def referenced_assets(html: Path) -> list[str]:
+    """Return the asset paths used by ``html``, with POSIX separators, in slide order."""
+    return [reference.replace("\\", "/") for reference in ASSET_REFERENCE.findall(html.read_text())]
+
+
+def _rewrite(match: re.Match, references: dict[str, str]) -> str:
+    reference = match.group(1)
+    return match.group(0).replace(reference, references.get(reference, reference))
+
+
+def dedupe_assets(html: Path) -> dict[str, str]:
+    """
+    Point the references of ``html`` to byte-identical assets at the first of them.
+
+    Only files of equal size are hashed. Returns the rewritten references, whose files are
+    left for :func:`prune_assets`.
+    """
+    text = html.read_text()
+    by_size: dict[int, list[str]] = {}
+    for reference in dict.fromkeys(ASSET_REFERENCE.findall(text)):
+        file = html.parent / reference.replace("\\", "/")
+        if file.is_file():
+            by_size.setdefault(file.stat().st_size, []).append(reference)
+
+    rewrites = {}
+    for size, references in by_size.items():
+        if len(references) < 2:  # noqa: PLR2004
+            continue
+        first_by_digest: dict[str, str] = {}
+        for reference in references:
+            with (html.parent / reference.replace("\\", "/")).open("rb") as stream:
+                digest = hashlib.file_digest(stream, "sha256").hexdigest()
+            first = first_by_digest.setdefault(digest, reference)
+            if first != reference:
+                rewrites[reference] = first
+                logger.debug("Asset '%s' is identical to '%s' (%d bytes)", reference, first, size)
+
+    if rewrites:
+        html.write_text(ASSET_REFERENCE.sub(lambda match: _rewrite(match, rewrites), text))
+        logger.info("Merged %d duplicate asset(s) of '%s'", len(rewrites), html)
+    return rewrites
+
+
+def prune_assets(html: Path, assets: Path) -> list[Path]:
+    """Delete the files of ``assets`` that ``html`` does not reference and return them."""
+    referenced = {(html.parent / reference).resolve() for reference in referenced_assets(html)}
+    removed = [file for file in sorted(assets.iterdir()) if file.is_file() and file.resolve() not in referenced]
+    freed = sum(file.stat().st_size for file in removed)
+    for file in removed:
+        file.unlink()
+    if removed:
+        logger.info("Removed %d unreferenced file(s) from '%s' (%.1f MB)", len(removed), assets, freed / 1e6)
+    return removed
+
+
+def _ffmpeg(*args: str) -> subprocess.CompletedProcess:
+    command = [config.ffmpeg_executable, "-hide_banner", "-nostats", *args]
+    return subprocess.run(command, capture_output=True, text=True, check=True)  # noqa: S603
+
+
+def static_since(video: Path, *, min_duration: float = 0.5, noise: float = 0.001) -> float | None:
+    """
+    Return the time from which ``video`` no longer changes, or ``None`` if its end moves.
+
+    Changes below ``noise`` (ffmpeg's ``freezedetect`` threshold) are ignored, and the video
+    must be still for at least ``min_duration`` seconds, or be still as a whole.
+    """
+    log = _ffmpeg("-i", str(video), "-vf", f"freezedetect=n={noise}:d={min_duration}", "-an", "-f", "null", "-").stderr
+    starts, ends = FREEZE_START.findall(log), FREEZE_END.findall(log)
+    # A freeze lasting until the end of the video is never closed by a freeze_end
+    return float(starts[-1]) if len(starts) > len(ends) else None
+
+
+def extract_still(video: Path, still: Path, quality: int = 90) -> Path:
+    """Save the last frame of ``video`` as ``still``, in the format of its extension."""
+    with tempfile.TemporaryDirectory() as folder:
+        frame = Path(folder) / "frame.png"
+        # Every decoded frame of the last second overwrites the previous one
+        _ffmpeg("-sseof", "-1", "-i", str(video), "-update", "1", "-an", str(frame))
+        with Image.open(frame) as image:
+            image.save(still, quality=quality)
+    return still
+
+
+def trim_video(video: Path, clip: Path, duration: float, encoder_options: tuple[str, ...] = ()) -> Path:
+    """Write the first ``duration`` seconds of ``video`` to ``clip``, re-encoded with ``encoder_options``."""
+    _ffmpeg(
+        "-y",
+        "-i",
+        str(video),
+        "-t",
+        f"{duration:.3f}",
+        "-an",
+        "-vcodec",
+        "libx264",
+        "-pix_fmt",
+        "yuv420p",
+        *encoder_options,
+        str(clip),
+    )
+    return clip
+
+
+def export_stills(
+    html: Path,
+    *,
+    image_format: str = "webp",
+    min_duration: float = 0.5,
+    encoder_options: tuple[str, ...] = (),
+) -> list[Path]:
+    """
+    Shorten the slide videos of ``html`` that end still, and return the replaced videos.
+
+    A slide whose video never changes gets its last frame as background image instead. A slide
+    whose video ends still for ``min_duration`` seconds gets a clip of the moving part, which
+    the browser keeps showing on its last frame. Reveal.js ignores the video of a slide that
+    also has a background image, so both are never set together. Looping slides are left as
+    is. The replaced videos are left for :func:`prune_assets`.
+    """
+    replaced = []
+
+    def rewrite(match: re.Match) -> str:
+        section = match.group(0)
+        reference = VIDEO_REFERENCE.search(section)
+        if reference is None or "data-background-video-loop" in section or "data-background-image" in section:
+            return section
+        reference = reference.group(1)
+        video = html.parent / reference.replace("\\", "/")
+        if reference.startswith("data:") or (since := static_since(video, min_duration=min_duration)) is None:
+            return section
+
+        replaced.append(video)
+        if since < STILL_START:
+            still = extract_still(video, video.with_suffix(f".{image_format}"))
+            still_reference = reference.removesuffix(video.name) + still.name
+            return VIDEO_REFERENCE.sub(lambda _: f'data-background-image="{still_reference}"', section)
+        # The clip's still end is shorter than min_duration, so running this again leaves it as is
+        clip = trim_video(video, video.with_stem(f"{video.stem}_clip"), since + CLIP_MARGIN, encoder_options)
+        return section.replace(reference, reference.removesuffix(video.name) + clip.name)
+
+    html.write_text(SECTION.sub(rewrite, html.read_text()))
+    if replaced:
+        logger.info("Shortened %d slide video(s) ending on a still frame in '%s'", len(replaced), html)
+    return replaced
+
+
+def posix_references(html: Path) -> None:
+    """Rewrite the asset references of ``html`` with forward slashes, which browsers expect."""
+    text = html.read_text()
+    posix = ASSET_REFERENCE.sub(lambda match: match.group(0).replace("\\", "/"), text)
+    if posix != text:
+        html.write_text(posix)
+
+
+def write_variants(
+    html: Path,
+    heights: list[int],
+    encoder_options: tuple[str, ...] = (),
+) -> dict[int, list[Path]]:
+    """
+    Encode the slide videos of ``html`` at each of ``heights``, into ``<assets>/<height>p/``.
+
+    Existing variants newer than their video are kept, and variants of videos ``html`` no
+    longer references are deleted. Returns the variant files by height.
+    """
+    videos = [html.parent / reference.replace("\\", "/") for reference in VIDEO_REFERENCE.findall(html.read_text())]
+    videos = [video for video in dict.fromkeys(videos) if video.is_file()]
+    variants: dict[int, list[Path]] = {}
+    for height in heights:
+        variants[height] = []
+        for video in videos:
+            variant = video.parent / f"{height}p" / video.name
+            if not variant.exists() or variant.stat().st_mtime < video.stat().st_mtime:
+                variant.parent.mkdir(exist_ok=True)
+                _ffmpeg(
+                    "-y",
+                    "-i",
+                    str(video),
+                    "-vf",
+                    f"scale=-2:{height}",
+                    "-an",
+                    "-vcodec",
+                    "libx264",
+                    "-pix_fmt",
+                    "yuv420p",
+                    *encoder_options,
+                    str(variant),
+                )
+            variants[height].append(variant)
+        for folder in {video.parent / f"{height}p" for video in videos}:
+            prune = [file for file in folder.iterdir() if file.is_file() and file not in variants[height]]
+            for file in prune:
+                file.unlink()
+    return variants
+
+
+def min_downlink_mbps(height: int) -> float:
+    """
+    Return the connection speed from which a variant of ``height`` pixels is picked, by pixel count.
+
+    Browsers report at most 10 Mbps (``navigator.connection.downlink``), which is enough for 4K.
+    """
+    return 10 * (height / 2160) ** 2
+
+
+STREAMING_MARKER = "<!-- deck:streaming -->"
+STREAMING_SCRIPT = """<script>
+      // Pick the largest video variant that fits the screen and the connection (or ?quality=540p),
+      // and let the browser buffer the next slides while the current one is presented
+      (() => {
+        const variants = %(variants)s;
+        const preload = %(preload)d;
+        const quality = new URLSearchParams(location.search).get("quality");
+        const screenHeight = screen.height * devicePixelRatio;
+        const downlink = navigator.connection?.downlink ?? Infinity;
+        const variant =
+          variants.find((variant) => `${variant.height}p` === quality) ??
+          variants.find((variant) => variant.height <= screenHeight && variant.minMbps <= downlink) ??
+          variants[variants.length - 1];
+        if (variant.folder) {
+          for (const section of document.querySelectorAll("section[data-background-video]")) {
+            const file = section.dataset.backgroundVideo;
+            const name = file.lastIndexOf("/") + 1;
+            section.dataset.backgroundVideo = `${file.slice(0, name)}${variant.folder}/${file.slice(name)}`;
+          }
+        }
+        const bufferNext = () => {
+          const { h } = Reveal.getIndices();
+          for (let next = h + 1; next <= h + preload; next++) {
+            const video = Reveal.getSlideBackground(next)?.querySelector("video");
+            if (video) video.preload = "auto";
+          }
+        };
+        Reveal.on("ready", bufferNext);
+        Reveal.on("slidechanged", bufferNext);
+      })();
+    </script>
+"""
+STREAMING_BLOCK = re.compile(re.escape(STREAMING_MARKER) + r".*?</script>\s*", re.DOTALL)
+REVEAL_INITIALIZE = re.compile(r"<script>\s*Reveal\.initialize\(")
+
+
+def streaming_export(
+    html: Path,
+    *,
+    source_height: int,
+    heights: tuple[int, ...] = (1080, 540),
+    preload: int = 2,
+    encoder_options: tuple[str, ...] = (),
+) -> None:
+    """
+    Prepare ``html`` for presenting over slow connections.
+
+    References get POSIX paths, every slide video gets lower resolution variants (see
+    :func:`write_variants`) and a script picks the variant to play in the browser, then keeps
+    the ``preload`` next slide videos buffering.
+    """
+    posix_references(html)
+    heights = sorted((height for height in heights if height < source_height), reverse=True)
+    write_variants(html, heights, encoder_options)
+    variants = [
+        {"folder": folder, "height": height, "minMbps": round(min_downlink_mbps(height), 1)}
+        for folder, height in [("", source_height), *((f"{height}p", height) for height in heights)]
+    ]
+    block = STREAMING_MARKER + "\n    " + STREAMING_SCRIPT % {"variants": json.dumps(variants), "preload": preload}
+
+    text = STREAMING_BLOCK.sub("", html.read_text())
+    initialize = REVEAL_INITIALIZE.search(text)
+    if initialize is None:
+        msg = f"No Reveal.initialize script found in '{html}'"
+        raise ValueError(msg)
+    html.write_text(text[: initialize.start()] + block + "    " + text[initialize.start() :])
+    logger.info("Streaming export of '%s' with variants %s", html, ", ".join(f"{height}p" for height in heights))
+
+
+REMOTE_ASSET = re.compile(r"""(<(?:link|script)\b[^>]*?\b(?:href|src)=["'])(https?://[^"']+)(["'])""")
+VENDOR_CACHE = Path(".build/vendor")
+CSS_IMPORT = re.compile(r"""@import\s+(?:url\(\s*)?["']?([^"')\s;]+)["']?\s*\)?[^;]*;""")
+CSS_URL = re.compile(r"""url\(\s*["']?([^"')\s]+)["']?\s*\)""")
+# Stylesheets imported by a stylesheet (group 1), and the other files it references (group 2)
+CSS_REFERENCE = re.compile(f"{CSS_IMPORT.pattern}|{CSS_URL.pattern}")
+
+
+def _download(url: str, cache: Path) -> Path:
+    name = posixpath.basename(urlsplit(url).path)
+    cached = cache / f"{hashlib.sha256(url.encode()).hexdigest()[:16]}-{name}"
+    if not cached.exists():
+        logger.info("Downloading '%s'", url)
+        cache.mkdir(parents=True, exist_ok=True)
+        with urllib.request.urlopen(url) as response:  # noqa: S310
+            cached.write_bytes(response.read())
+    return cached
+
+
+def _vendor_file(url: str, file: Path, cache: Path, vendored: set[Path], *, stylesheet: bool) -> None:
+    """
+    Copy ``url`` to ``file``, with the stylesheets and fonts it references if it is a ``stylesheet``.
+
+    Whether a file is a stylesheet follows from how it is loaded (``<link>`` or ``@import``), since
+    URLs like Google Fonts' ``/css?family=...`` have no extension. Relative references keep their
+    path next to ``file``, e.g. the ``fonts/`` folder of a reveal.js theme; other URLs are stored
+    in ``remote/`` and the stylesheet is rewritten.
+    """
+    if file in vendored:
+        return
+    vendored.add(file)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    cached = _download(url, cache)
+    if not stylesheet:
+        shutil.copyfile(cached, file)
+        return
+
+    def localize(match: re.Match) -> str:
+        reference = match.group(1) or match.group(2)
+        if reference.startswith(("data:", "#")):
+            return match.group(0)
+        source = urldefrag(urljoin(url, reference)).url
+        imported = match.group(1) is not None
+        path = posixpath.normpath(urlsplit(reference).path)
+        if not urlsplit(reference).netloc and not path.startswith(("/", "..")):
+            _vendor_file(source, file.parent / path, cache, vendored, stylesheet=imported)
+            return match.group(0)
+        name = posixpath.basename(urlsplit(source).path)
+        if imported and not name.endswith(".css"):
+            name += ".css"
+        local = f"remote/{hashlib.sha256(source.encode()).hexdigest()[:16]}-{name}"
+        _vendor_file(source, file.parent / local, cache, vendored, stylesheet=imported)
+        return match.group(0).replace(reference, local)
+
+    file.write_text(CSS_REFERENCE.sub(localize, cached.read_text(encoding="utf-8")), encoding="utf-8")
+
+
+def vendor_assets(html: Path, assets: Path, cache: Path = VENDOR_CACHE) -> list[str]:
+    """
+    Serve the stylesheets and scripts ``html`` loads from CDNs from ``<assets>/vendor/``.
+
+    Each URL is only downloaded once into ``cache``. The files are the CDN's minified builds
+    (reveal.js, its theme and highlight.js), together with the stylesheets and fonts they
+    reference (e.g. the ``fonts/`` folder of the theme). Returns the URLs that were replaced.
+    """
+    vendor = assets / "vendor"
+    urls = []
+    vendored: set[Path] = set()
+
+    def localize(match: re.Match) -> str:
+        url = match.group(2)
+        file = vendor / posixpath.basename(urlsplit(url).path)
+        _vendor_file(url, file, cache, vendored, stylesheet=match.group(1).startswith("<link"))
+        urls.append(url)
+        return match.group(1) + file.relative_to(html.parent).as_posix() + match.group(3)
+
+    html.write_text(REMOTE_ASSET.sub(localize, html.read_text()))
+    return urls
+
+
+def _inline_css(file: Path) -> str:
+    """Return stylesheet ``file`` with its imports inlined and the files it references as data URIs."""
+
+    def inline(match: re.Match) -> str:
+        reference = match.group(1) or match.group(2)
+        if reference.startswith(("data:", "#")) or urlsplit(reference).netloc:
+            return match.group(0)
+        target = file.parent / urlsplit(reference).path
+        if match.group(1):
+            return _inline_css(target)
+        return match.group(0).replace(reference, file_to_data_uri(target))
+
+    return CSS_REFERENCE.sub(inline, file.read_text(encoding="utf-8"))
+
+
+# Reveal.js splits background URLs on commas, which breaks data URIs (same fix as manim-slides)
+DATA_URI_FIX = """<script>
+      Reveal.on("ready", () => {
+        for (const video of Reveal.getBackgroundsElement().querySelectorAll(".slide-background video")) {
+          const sources = [...video.querySelectorAll("source")].map((source) => source.getAttribute("src"));
+          if (sources[0]?.match(/^data:video.*;base64$/)) video.setAttribute("src", sources.join(","));
+        }
+      });
+    </script>
+"""
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+LOCAL_STYLESHEET = re.compile(r"""<link\b[^>]*\bhref=["'](?!https?:|data:)([^"']+\.css)["'][^>]*>""")
+LOCAL_SCRIPT = re.compile(r"""<script\b[^>]*\bsrc=["'](?!https?:|data:)([^"']+\.js)["'][^>]*>\s*</script>""")
+
+
+def bundle(html: Path, dest: Path) -> Path:
+    """
+    Pack ``html`` and everything it loads into ``dest``, opened without any network access.
+
+    A ``.zip`` destination is an archive of the HTML file and its assets folder, with the
+    already compressed videos and images stored as is. An ``.html`` destination is a single
+    file, with stylesheets, scripts, videos and images inlined; the lower resolution variants
+    of :func:`streaming_export` are left out of it.
+    """
+    text = html.read_text()
+    # Commented out tags of the manim-slides template point to files that do not exist
+    code = HTML_COMMENT.sub("", STREAMING_BLOCK.sub("", text))
+    local = {reference.replace("\\", "/") for reference in ASSET_REFERENCE.findall(code)}
+    local.update(LOCAL_STYLESHEET.findall(code) + LOCAL_SCRIPT.findall(code))
+
+    if dest.suffix == ".zip":
+        with zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(html.name, text)
+            # Whole asset folders, for the resolution variants of the videos
+            folders = {(html.parent / reference).parent for reference in local} - {html.parent}
+            for file in sorted({file for folder in folders for file in folder.rglob("*") if file.is_file()}):
+                stored = file.suffix in {".mp4", ".webm", ".webp", ".png", ".avif", ".jpg"}
+                archive.write(
+                    file,
+                    file.relative_to(html.parent),
+                    compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED,
+                )
+    elif dest.suffix == ".html":
+        text = LOCAL_STYLESHEET.sub(lambda match: f"<style>{_inline_css(html.parent / match.group(1))}</style>", code)
+        text = LOCAL_SCRIPT.sub(lambda match: f"<script>{(html.parent / match.group(1)).read_text()}</script>", text)
+        text = ASSET_REFERENCE.sub(
+            lambda match: match.group(0).replace(
+                match.group(1),
+                file_to_data_uri(html.parent / match.group(1).replace("\\", "/")),
+            ),
+            text,
+        )
+        initialize = REVEAL_INITIALIZE.search(text)
+        if initialize is None:
+            msg = f"No Reveal.initialize script found in '{html}'"
+            raise ValueError(msg)
+        text = text[: initialize.start()] + DATA_URI_FIX + "    " + text[initialize.start() :]
+        dest.write_text(text)
+    else:
+        msg = f"Unsupported bundle format {dest.suffix!r}, expected '.zip' or '.html'"
+        raise ValueError(msg)
+    logger.info("Offline bundle written in '%s' (%.1f MB)", dest, dest.stat().st_size / 1e6)
+    return dest
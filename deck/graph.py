@@ -0,0 +1,168 @@
+"""
+Reddit comment trees drawn as a handful of mobjects.
+
+A thread is stored as a ``parents`` array: node 0 is the submission and every other node is a
+comment holding the index of the node it answers. The tree is laid out level by level with
+NumPy (each node gets a share of its parent's angle proportional to its number of leaves), so
+the cost grows with the depth of the thread rather than with one Python call per comment.
+Layouts are cached in memory and as ``.npz`` files under manim's media folder, keyed by a hash
+of the tree and the layout settings.
+
+:class:`CommentGraph` then draws all edges as one :class:`~manim.VMobject` of disjoint segments
+and all comments as another one made of small discs, instead of one ``Line`` and ``Dot`` each.
+"""
+
+import hashlib
+import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import GREY, ORANGE, Circle, VGroup, VMobject, config
+
+# Outline of a node, a circle made of 4 cubic curves (16 points)
+NODE_OUTLINE = Circle(radius=1, num_components=5).points
+
+_layouts: dict[str, np.ndarray] = {}
+
+
+def load_thread(file: str | Path) -> np.ndarray:
+    """
+    Load the comment tree of a thread exported by praw, as a ``parents`` array.
+
+    ``file`` holds the comments as a JSON list or as JSON lines, each with an ``id`` and a
+    ``parent_id`` (``t1_<comment>`` or ``t3_<submission>``). Comments whose parent is missing
+    from the export (e.g. deleted) are attached to the submission.
+    """
+    file = Path(file)
+    text = file.read_text(encoding="utf-8")
+    records = json.loads(text) if file.suffix == ".json" else [json.loads(line) for line in text.splitlines() if line]
+    ids = np.array([str(record["id"]) for record in records])
+    parent_ids = np.array([str(record["parent_id"]).split("_", 1)[-1] for record in records])
+
+    order = np.argsort(ids)
+    position = np.minimum(np.searchsorted(ids[order], parent_ids), max(len(ids) - 1, 0))
+    found = ids[order][position] == parent_ids if len(ids) else np.zeros(0, dtype=bool)
+    return np.concatenate(([-1], np.where(found, order[position] + 1, 0)))
+
+
+def tree_depths(parents: np.ndarray) -> np.ndarray:
+    """Return the depth of every node, by jumping from ancestor to ancestor for all nodes at once."""
+    depths = np.zeros(len(parents), dtype=int)
+    ancestors = parents.copy()
+    for _ in range(len(parents)):
+        climbing = ancestors >= 0
+        if not climbing.any():
+            return depths
+        depths += climbing
+        ancestors = np.where(climbing, parents[np.maximum(ancestors, 0)], -1)
+    msg = "The comment tree contains a cycle"
+    raise ValueError(msg)
+
+
+def tree_layout(parents: np.ndarray, *, radial: bool = True, level_gap: float = 1) -> np.ndarray:
+    """
+    Return the ``(n, 2)`` positions of the nodes of tree ``parents``.
+
+    With ``radial``, levels are circles around the submission, otherwise rows below it. Nodes are
+    handled one level at a time: leaf counts are summed bottom-up, then every level splits the
+    angle (or width) of its parents among siblings with a cumulative sum.
+    """
+    parents = np.asarray(parents, dtype=int)
+    depths = tree_depths(parents)
+    levels = [np.flatnonzero(depths == depth) for depth in range(depths.max() + 1)]
+
+    # Number of leaves under every node
+    leaves = np.ones(len(parents))
+    children_leaves = np.zeros(len(parents))
+    for nodes in reversed(levels[1:]):
+        leaves[nodes] = np.where(children_leaves[nodes] > 0, children_leaves[nodes], 1)
+        children_leaves += np.bincount(parents[nodes], weights=leaves[nodes], minlength=len(parents))
+
+    # Share of the full turn (or width) given to every node, siblings side by side
+    start = np.zeros(len(parents))
+    span = np.zeros(len(parents))
+    span[levels[0]] = 1
+    for level in levels[1:]:
+        nodes = level[np.argsort(parents[level], kind="stable")]
+        node_parents = parents[nodes]
+        share = span[node_parents] * leaves[nodes] / children_leaves[node_parents]
+        before = np.cumsum(share) - share
+        group_starts = np.flatnonzero(np.r_[True, node_parents[1:] != node_parents[:-1]])
+        group_sizes = np.diff(np.r_[group_starts, len(nodes)])
+        start[nodes] = start[node_parents] + before - np.repeat(before[group_starts], group_sizes)
+        span[nodes] = share
+
+    center = start + span / 2
+    if radial:
+        angle = 2 * np.pi * center
+        return np.stack((depths * level_gap * np.cos(angle), depths * level_gap * np.sin(angle)), axis=1)
+    return np.stack((center - 0.5, -depths * level_gap), axis=1)
+
+
+def _cache_file(key: str) -> Path:
+    return config.get_dir("media_dir") / "layouts" / f"{key}.npz"
+
+
+def cached_tree_layout(parents: np.ndarray, *, radial: bool = True, level_gap: float = 1) -> np.ndarray:
+    """Return :func:`tree_layout` of ``parents``, computing it only for a new tree or new settings."""
+    parents = np.ascontiguousarray(parents, dtype=np.int64)
+    digest = hashlib.sha256(parents.tobytes())
+    digest.update(repr((radial, level_gap)).encode())
+    key = digest.hexdigest()
+    if key in _layouts:
+        return _layouts[key]
+
+    file = _cache_file(key)
+    if file.exists():
+        with np.load(file) as data:
+            positions = data["positions"]
+    else:
+        positions = tree_layout(parents, radial=radial, level_gap=level_gap)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so concurrent workers never load a partial archive
+        with tempfile.NamedTemporaryFile(dir=file.parent, suffix=".tmp", delete=False) as stream:
+            np.savez(stream, positions=positions)
+        Path(stream.name).replace(file)
+    _layouts[key] = positions
+    return positions
+
+
+class CommentGraph(VGroup):
+    """
+    Comment tree of a thread, as one mobject of edges and one of nodes.
+
+    The tree is laid out with :func:`cached_tree_layout` and scaled to fit a square of side
+    ``size``; ``nodes`` is drawn above ``edges``.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        parents: np.ndarray,
+        *,
+        radial: bool = True,
+        size: float = 6,
+        node_radius: float = 0.02,
+        node_color: str = ORANGE,
+        edge_color: str = GREY,
+        edge_width: float = 1,
+        **kwargs: object,
+    ) -> None:
+        """Lay out and draw the tree ``parents`` (see :func:`load_thread`)."""
+        super().__init__(**kwargs)
+        positions = cached_tree_layout(parents, radial=radial)
+        positions = positions - (positions.max(axis=0) + positions.min(axis=0)) / 2
+        positions *= size / max(np.ptp(positions, axis=0).max(), 1e-9)
+        points = np.zeros((len(positions), 3))
+        points[:, :2] = positions
+
+        # One straight cubic curve per edge: both ends and two control points on the segment
+        children = np.flatnonzero(np.asarray(parents) >= 0)
+        ends = points[np.asarray(parents)[children]], points[children]
+        weights = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+        self.edges = VMobject(stroke_color=edge_color, stroke_width=edge_width)
+        self.edges.points = (ends[0][:, None] + weights * (ends[1] - ends[0])[:, None]).reshape(-1, 3)
+
+        self.nodes = VMobject(fill_color=node_color, fill_opacity=1, stroke_width=0)
+        self.nodes.points = (points[:, None] + node_radius * NODE_OUTLINE[None]).reshape(-1, 3)
+        self.add(self.edges, self.nodes)
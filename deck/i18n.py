@@ -0,0 +1,63 @@
+"""
+String catalogs of the localized decks.
+
+Every locale is a ``locales/<locale>.toml`` file with one table per slide segment, and slides
+look their strings up by dotted key (``"title.subtitle"``). The keys a segment uses are read
+from its source, so a segment's digest (see :mod:`deck.segments`) only depends on its own
+strings: segments showing the same strings in two locales are rendered once and shared.
+"""
+
+import ast
+import tomllib
+from functools import cache
+from pathlib import Path
+
+LOCALES_DIR = Path(__file__).parent.parent / "locales"
+# Name of the scene method returning the string of a key
+TRANSLATE_METHOD = "tr"
+
+
+def _flatten(table: dict, prefix: str = "") -> dict[str, str]:
+    strings = {}
+    for key, value in table.items():
+        if isinstance(value, dict):
+            strings.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            strings[f"{prefix}{key}"] = value
+    return strings
+
+
+@cache
+def load_catalog(locale: str) -> dict[str, str]:
+    """Return the strings of ``locale`` by dotted key."""
+    file = LOCALES_DIR / f"{locale}.toml"
+    if not file.is_file():
+        available = ", ".join(sorted(path.stem for path in LOCALES_DIR.glob("*.toml")))
+        msg = f"Unknown locale {locale!r}, expected one of: {available}"
+        raise ValueError(msg)
+    with file.open("rb") as stream:
+        return _flatten(tomllib.load(stream))
+
+
+def translate(locale: str, key: str) -> str:
+    """Return the string ``key`` of ``locale``."""
+    catalog = load_catalog(locale)
+    if key not in catalog:
+        msg = f"Missing string {key!r} in '{LOCALES_DIR / locale}.toml'"
+        raise KeyError(msg)
+    return catalog[key]
+
+
+def catalog_keys(source: str) -> list[str]:
+    """Return the keys looked up with ``self.tr("...")`` in ``source``."""
+    return sorted(
+        {
+            node.args[0].value
+            for node in ast.walk(ast.parse(source))
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == TRANSLATE_METHOD
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+        },
+    )
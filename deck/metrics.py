@@ -0,0 +1,95 @@
+"""
+Result metrics read from the output files of the fraud-detection experiments.
+
+A result file holds one row per prediction, with the columns ``coin``, ``label`` and
+``prediction`` (and optionally ``fold``), or one row per evaluated coin and fold, with an
+``accuracy`` column instead of the last two. Files are ``.csv`` with a header, ``.json`` lists
+of records, or ``.parquet`` (which needs pandas with a Parquet engine). Accuracies are reduced
+over all coins and folds at once, and the digest of a result slide covers its result file
+(see :mod:`deck.segments`), so a nightly run only re-renders the slides whose numbers changed.
+"""
+
+import csv
+import json
+from pathlib import Path
+
+import numpy as np
+
+# Score shown for an accuracy that rounds to 1 without reaching it
+ALMOST_ONE = "0.999..."
+
+
+def load_results(file: str | Path) -> dict[str, np.ndarray]:
+    """Load the result table of ``file``, by column name."""
+    file = Path(file)
+    if file.suffix == ".parquet":
+        try:
+            import pandas as pd  # noqa: PLC0415
+        except ImportError as error:
+            msg = f"Reading {file} needs pandas and pyarrow, or export the results as .csv or .json"
+            raise ImportError(msg) from error
+        frame = pd.read_parquet(file)
+        return {column: frame[column].to_numpy() for column in frame.columns}
+
+    with file.open(newline="", encoding="utf-8") as stream:
+        records = json.load(stream) if file.suffix == ".json" else list(csv.DictReader(stream))
+    if not records:
+        msg = f"{file} has no results"
+        raise ValueError(msg)
+    return {column: np.array([record[column] for record in records]) for column in records[0]}
+
+
+def _as_numbers(values: np.ndarray) -> np.ndarray | None:
+    """Return ``values`` as floats, or ``None`` if one of them is not a number (e.g. a class name)."""
+    try:
+        return values.astype(float)
+    except (TypeError, ValueError):
+        return None
+
+
+def correct_predictions(labels: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+    """
+    Return whether each prediction matches its label.
+
+    Numeric columns are compared as numbers, so ``1`` matches ``1.0`` (e.g. a CSV file written
+    from a float column); columns of class names are compared as strings.
+    """
+    numeric_labels, numeric_predictions = _as_numbers(labels), _as_numbers(predictions)
+    if numeric_labels is not None and numeric_predictions is not None:
+        return numeric_labels == numeric_predictions
+    return labels.astype(str) == predictions.astype(str)
+
+
+def per_coin_accuracy(table: dict[str, np.ndarray]) -> dict[str, float]:
+    """
+    Return the accuracy of each coin in ``table``, averaged over its folds.
+
+    Predictions are counted per coin and fold with a single ``bincount``; folds without a row
+    for a coin are left out of its average.
+    """
+    coins, coin_index = np.unique(table["coin"].astype(str), return_inverse=True)
+    folds, fold_index = np.unique(table.get("fold", np.zeros(len(coin_index))).astype(str), return_inverse=True)
+    cell = coin_index * len(folds) + fold_index
+    if "accuracy" in table:
+        values = table["accuracy"].astype(float)
+    else:
+        values = correct_predictions(table["label"], table["prediction"]).astype(float)
+
+    counts = np.bincount(cell, minlength=len(coins) * len(folds)).reshape(len(coins), len(folds))
+    sums = np.bincount(cell, weights=values, minlength=counts.size).reshape(counts.shape)
+    fold_accuracy = sums / np.maximum(counts, 1)
+    accuracy = (fold_accuracy * (counts > 0)).sum(axis=1) / (counts > 0).sum(axis=1)
+    return dict(zip(coins.tolist(), accuracy.tolist(), strict=True))
+
+
+def format_score(accuracy: float, digits: int = 3) -> str:
+    """Format ``accuracy`` for a results table, e.g. ``0.81`` or ``0.999...``."""
+    rounded = round(accuracy, digits)
+    if rounded == 1 and accuracy < 1:
+        return ALMOST_ONE
+    return f"{rounded:g}"
+
+
+def load_scores(file: str | Path, digits: int = 3) -> dict[str, str]:
+    """Return the formatted accuracy of each coin of result file ``file``."""
+    return {coin: format_score(value, digits) for coin, value in per_coin_accuracy(load_results(file)).items()}
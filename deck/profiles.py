@@ -0,0 +1,128 @@
+"""
+Named render profiles.
+
+Profiles are the ``[profile:<name>]`` sections of ``manim.cfg`` (manim itself ignores them).
+Each one sets the resolution, frame rate and x264 encoder settings, and renders into its own
+media and slides folders, so switching profiles never invalidates another profile's renders.
+"""
+
+import configparser
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+from manim import config
+from manim.constants import RendererType
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_webm_format
+from manim_slides.defaults import FOLDER_PATH
+
+CONFIG_FILE = Path("manim.cfg")
+SECTION_PREFIX = "profile:"
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    pixel_width: int
+    pixel_height: int
+    frame_rate: float
+    preset: str = "medium"
+    crf: int = 23
+
+    @property
+    def folder(self) -> Path:
+        """
+        Slides folder of this profile.
+
+        The path is absolute because manim-slides reads the files of ``<folder>/<scene>.json``
+        relative to the parent of ``<folder>``, which only matches for top-level folders.
+        """
+        return (FOLDER_PATH / self.name).resolve()
+
+    @property
+    def media_dir(self) -> Path:
+        """
+        Manim media folder of this profile and its encoder settings.
+
+        Manim's partial movie hashes ignore ffmpeg options, so movies encoded with another preset
+        or CRF must live in another folder to not be reused.
+        """
+        return Path("media") / self.name / f"{self.preset}-crf{self.crf}"
+
+
+def load_profiles(file: Path = CONFIG_FILE) -> dict[str, Profile]:
+    """Read all profiles defined in ``file``."""
+    parser = configparser.ConfigParser()
+    parser.read(file)
+    return {
+        section.removeprefix(SECTION_PREFIX): Profile(
+            name=section.removeprefix(SECTION_PREFIX),
+            pixel_width=parser.getint(section, "pixel_width"),
+            pixel_height=parser.getint(section, "pixel_height"),
+            frame_rate=parser.getfloat(section, "frame_rate"),
+            preset=parser.get(section, "preset", fallback=Profile.preset),
+            crf=parser.getint(section, "crf", fallback=Profile.crf),
+        )
+        for section in parser.sections()
+        if section.startswith(SECTION_PREFIX)
+    }
+
+
+def get_profile(name: str, file: Path = CONFIG_FILE) -> Profile:
+    """Return profile ``name``, raising a :class:`ValueError` listing the known ones if missing."""
+    profiles = load_profiles(file)
+    if name not in profiles:
+        msg = f"Unknown render profile {name!r}, expected one of: {', '.join(profiles)}"
+        raise ValueError(msg)
+    return profiles[name]
+
+
+def apply_profile(profile: Profile) -> None:
+    """Configure manim and the video encoder of the current process for ``profile``."""
+    config.pixel_width = profile.pixel_width
+    config.pixel_height = profile.pixel_height
+    config.frame_rate = profile.frame_rate
+    config.media_dir = str(profile.media_dir)
+    ProfileFileWriter.encoder_options = ("-preset", profile.preset, "-crf", str(profile.crf))
+
+
+class ProfileFileWriter(SceneFileWriter):
+    """Scene file writer passing the encoder options of the active profile to ffmpeg."""
+
+    encoder_options: tuple[str, ...] = ()
+
+    def open_movie_pipe(self, file_path: Path | None = None) -> None:
+        """Start ffmpeg like manim does for H.264 partial movie files, with the profile's options."""
+        if not self.encoder_options or config.renderer != RendererType.CAIRO or is_webm_format() or config.transparent:
+            super().open_movie_pipe(file_path)
+            return
+
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+
+        command = [
+            config.ffmpeg_executable,
+            "-y",
+            "-f",
+            "rawvideo",
+            "-s",
+            f"{config.pixel_width}x{config.pixel_height}",
+            "-pix_fmt",
+            "rgba",
+            "-r",
+            f"{config.frame_rate:g}",
+            "-i",
+            "-",
+            "-an",
+            "-loglevel",
+            config.ffmpeg_loglevel.lower(),
+            "-vcodec",
+            "libx264",
+            "-pix_fmt",
+            "yuv420p",
+            *self.encoder_options,
+            str(file_path),
+        ]
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)  # noqa: S603
@@ -0,0 +1,205 @@
+"""
+Render a presentation segment by segment, reusing every segment whose digest is unchanged.
+
+Usage: ``python -m deck.render main.py Presentation [--profile NAME] [--jobs [N]] [--trace FILE]``
+
+Segments are rendered as scenes of their own (see :mod:`deck.segments`) and stitched into
+``slides/<Presentation>.json``, so ``manim-slides present`` and ``manim-slides convert`` work
+on the result exactly as if the whole presentation had been rendered at once. Since segments do
+not share any mobject, the segments to render can be spread over a pool of processes.
+
+With ``--trace``, the rendered segments are instrumented (see :mod:`deck.trace`) and their
+events are written to a single Chrome trace, one process track per worker.
+"""
+
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import config, logger
+from manim_slides.config import PresentationConfig
+from manim_slides.defaults import FOLDER_PATH
+from manim_slides.utils import concatenate_video_files, merge_basenames
+
+from deck.profiles import Profile, ProfileFileWriter, apply_profile, get_profile
+from deck.renderer import DedupRenderer
+from deck.segments import Segment, collect_segments, load_scene, segment_scene
+from deck.trace import Tracer, write_trace
+
+
+def render_segment(  # noqa: PLR0913
+    file: Path,
+    scene_name: str,
+    segment: Segment,
+    *,
+    last: bool = False,
+    profile: Profile | None = None,
+    trace: bool = False,
+) -> list[dict] | None:
+    """
+    Render ``segment`` of scene ``scene_name`` defined in ``file``, with ``profile`` if given.
+
+    With ``trace``, the trace events of the render are returned.
+    """
+    scene_cls = segment_scene(load_scene(file, scene_name), segment)
+    if profile is None:
+        scene = scene_cls(renderer=DedupRenderer(camera_class=scene_cls.camera_class))
+    else:
+        apply_profile(profile)
+        renderer = DedupRenderer(file_writer_class=ProfileFileWriter, camera_class=scene_cls.camera_class)
+        scene = scene_cls(renderer=renderer, output_folder=profile.folder)
+    tracer = Tracer() if trace else None
+    if tracer is not None:
+        tracer.attach(scene)
+    scene.render()
+    logger.info("Segment %s: %d frame(s) reused without rasterizing", segment.name, scene.renderer.reused_frames)
+    if scene.mobjects and not last:
+        msg = (
+            f"Segment {segment.name!r} leaves {len(scene.mobjects)} mobject(s) on screen, "
+            "it cannot be rendered independently of the next one"
+        )
+        raise RuntimeError(msg)
+    return tracer.events if tracer is not None else None
+
+
+def stitch(scene_name: str, segments: list[Segment], folder: Path = FOLDER_PATH) -> Path:
+    """
+    Join the rendered segments into a single presentation configuration.
+
+    The last slide of a segment and the first slide of the next one form one slide of the
+    presentation, so their videos are concatenated. All other slides are used as is.
+    """
+    configs = [PresentationConfig.from_file(folder / f"{segment.scene_name}.json") for segment in segments]
+    files_folder = folder / "files" / scene_name
+    files_folder.mkdir(parents=True, exist_ok=True)
+
+    slides = list(configs[0].slides)
+    for segment_config in configs[1:]:
+        last, first = slides.pop(), segment_config.slides[0]
+        file = files_folder / merge_basenames([last.file, first.file]).name
+        rev_file = files_folder / f"{file.stem}_reversed{file.suffix}"
+        if not file.exists():
+            concatenate_video_files([last.file, first.file], file)
+        if not rev_file.exists():
+            concatenate_video_files([first.rev_file, last.rev_file], rev_file)
+        slides.append(last.model_copy(update={"file": file, "rev_file": rev_file}))
+        slides.extend(segment_config.slides[1:])
+
+    slide_path = folder / f"{scene_name}.json"
+    PresentationConfig(
+        slides=slides,
+        resolution=configs[0].resolution,
+        background_color=configs[0].background_color,
+    ).to_file(slide_path)
+    return slide_path
+
+
+def _render_in_worker(  # noqa: PLR0913
+    file: Path,
+    scene_name: str,
+    segment: Segment,
+    *,
+    last: bool,
+    profile: Profile | None,
+    trace: bool,
+) -> list[dict] | None:
+    # Progress bars of concurrent workers would overwrite each other
+    config.progress_bar = "none"
+    return render_segment(file, scene_name, segment, last=last, profile=profile, trace=trace)
+
+
+def render(  # noqa: PLR0913
+    file: Path,
+    scene_name: str,
+    *,
+    force: bool = False,
+    jobs: int = 1,
+    profile: Profile | None = None,
+    trace: Path | None = None,
+) -> Path:
+    """
+    Render the segments of ``scene_name`` that are not cached yet and stitch them.
+
+    With ``jobs > 1``, the segments are rendered by that many worker processes. With a
+    ``profile``, its settings are used and the slides are written to its own folder. With a
+    ``trace`` file, the trace events of the rendered segments are written to it.
+    """
+    folder = FOLDER_PATH
+    if profile is not None:
+        apply_profile(profile)
+        folder = profile.folder
+    segments = collect_segments(load_scene(file, scene_name))
+    pending = []
+    for index, segment in enumerate(segments):
+        if not force and (folder / f"{segment.scene_name}.json").exists():
+            logger.info("Segment %s is up to date (%s)", segment.name, segment.scene_name)
+        else:
+            pending.append((segment, index == len(segments) - 1))
+
+    events: list[dict] = []
+
+    if jobs > 1 and len(pending) > 1:
+        logger.info("Rendering %d segments with %d processes", len(pending), min(jobs, len(pending)))
+        # Cairo and Pango are not fork-safe, so workers start from a fresh interpreter
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending)), mp_context=context) as executor:
+            futures = [
+                executor.submit(
+                    _render_in_worker,
+                    file,
+                    scene_name,
+                    segment,
+                    last=last,
+                    profile=profile,
+                    trace=trace is not None,
+                )
+                for segment, last in pending
+            ]
+            for future in futures:
+                events.extend(future.result() or [])
+    else:
+        for segment, last in pending:
+            logger.info("Rendering segment %s (%s)", segment.name, segment.scene_name)
+            events.extend(
+                render_segment(file, scene_name, segment, last=last, profile=profile, trace=trace is not None) or [],
+            )
+
+    if trace is not None:
+        write_trace(events, trace)
+        logger.info("Trace of %d segment(s) written in '%s'", len(pending), trace)
+
+    slide_path = stitch(scene_name, segments, folder)
+    logger.info("Slide '%s' configuration written in '%s'", scene_name, slide_path)
+    return slide_path
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file", type=Path, help="Python file defining the presentation.")
+    parser.add_argument("scene", help="Name of the presentation scene.")
+    parser.add_argument("--profile", help="Render profile defined in manim.cfg (default: the [CLI] settings).")
+    parser.add_argument("--force", action="store_true", help="Render every segment, even if it is cached.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=1,
+        const=os.cpu_count(),
+        help="Number of segments rendered in parallel (default: 1, or the CPU count if given without a value).",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        help="Write a Chrome trace of the rendered segments (chrome://tracing, Perfetto, speedscope).",
+    )
+    args = parser.parse_args()
+    profile = get_profile(args.profile) if args.profile else None
+    render(args.file, args.scene, force=args.force, jobs=args.jobs, profile=profile, trace=args.trace)
+
+
+if __name__ == "__main__":
+    main()
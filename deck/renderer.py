@@ -0,0 +1,70 @@
+"""
+Cairo rendering that skips frames identical to the previous one.
+
+Manim only rasterizes a ``self.wait()`` without updaters once, but every other frame is drawn
+from scratch, even when the animations of a ``play`` call are done moving (e.g. the end of a
+lagged animation) or only move mobjects outside of the picture. :class:`DedupRenderer` hashes
+the state of the moving mobjects before drawing a frame, and writes the previous frame again
+when nothing changed, so rasterization time follows the number of distinct frames.
+"""
+
+import hashlib
+
+from manim import CairoRenderer, ImageMobject, Mobject, Scene
+from manim.utils.family import extract_mobject_family_members
+
+# Attributes of a mobject that change what Cairo draws, besides its points and pixels
+DRAWN_ATTRIBUTES = (
+    # Colors of point clouds (see deck.scatter)
+    "rgbas",
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "sheen_direction",
+    "z_index",
+    "resampling_algorithm",
+)
+
+
+class DedupRenderer(CairoRenderer):
+    """Cairo renderer reusing the last frame as long as the moving mobjects do not change."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        """Create the renderer, with the arguments of :class:`~manim.CairoRenderer`."""
+        super().__init__(*args, **kwargs)
+        self._state: bytes | None = None
+        self._frame = None
+        self.reused_frames = 0
+
+    def state_digest(self, mobjects: list[Mobject]) -> bytes:
+        """Hash everything that is drawn of ``mobjects`` and their family, and the camera frame."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((self.camera.frame_center, self.camera.frame_width, self.camera.frame_height)).encode())
+        for mobject in extract_mobject_family_members(mobjects):
+            digest.update(type(mobject).__name__.encode())
+            digest.update(mobject.points.tobytes())
+            for name in DRAWN_ATTRIBUTES:
+                value = getattr(mobject, name, None)
+                digest.update(value.tobytes() if hasattr(value, "tobytes") else repr(value).encode())
+            if isinstance(mobject, ImageMobject):
+                digest.update(mobject.pixel_array.tobytes())
+        return digest.digest()
+
+    def play(self, scene: Scene, *args: object, **kwargs: object) -> None:
+        """Play an animation, whose static background may differ from the previous one's."""
+        self._state = self._frame = None
+        super().play(scene, *args, **kwargs)
+
+    def render(self, scene: Scene, time: float, moving_mobjects: list[Mobject]) -> None:  # noqa: ARG002
+        """Draw and write a frame, or write the previous frame again if nothing moved."""
+        state = self.state_digest(moving_mobjects)
+        if state == self._state and self._frame is not None:
+            self.reused_frames += 1
+        else:
+            self.update_frame(scene, moving_mobjects)
+            self._frame = self.get_frame()
+            self._state = state
+        self.add_frame(self._frame)
@@ -0,0 +1,101 @@
+"""
+Scatter plots of large embeddings (BERT, GAT outputs, t-SNE projections) as point clouds.
+
+:class:`Scatter` holds all points of a plot in the ``points`` and ``rgbas`` arrays of a single
+:class:`~manim.PMobject`, which Cairo's camera draws straight into the frame's pixel array,
+so neither building nor drawing the plot makes a Python call per point. Colors come from the
+labels through a palette lookup. :class:`EmbeddingEpochs` animates a scatter through the
+positions of successive training epochs by interpolating the whole array in place. A plain
+``Transform`` between two scatters of the same size works too, since point clouds interpolate
+their arrays at once.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from manim import GREEN, RED, Animation, PMobject, color_to_rgba
+
+# Colors of the labels: 0 for non-scam, 1 for scam
+SCAM_COLORS = (GREEN, RED)
+
+
+def load_embedding(file: str | Path) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Load the 2D positions and the labels of an embedding from an ``.npz`` archive.
+
+    ``positions`` has the shape ``(n, 2)``, or ``(epochs, n, 2)`` for positions recorded during
+    training, and ``labels`` holds the ``n`` integer labels.
+    """
+    with np.load(file) as data:
+        return data["positions"], data["labels"]
+
+
+def fit_to_box(positions: np.ndarray, width: float, height: float) -> np.ndarray:
+    """
+    Center and scale ``positions`` (``(..., n, 2)``) into a ``width`` by ``height`` box.
+
+    Every ``(n, 2)`` frame of a stack is fitted on its own, keeping its aspect ratio, and the
+    result gets a zero ``z`` coordinate.
+    """
+    positions = np.asarray(positions, dtype=float)
+    low, high = positions.min(axis=-2, keepdims=True), positions.max(axis=-2, keepdims=True)
+    extent = np.maximum(high - low, 1e-9)
+    scale = np.minimum(width / extent[..., 0], height / extent[..., 1])[..., None]
+    fitted = np.zeros((*positions.shape[:-1], 3))
+    fitted[..., :2] = (positions - (low + high) / 2) * scale
+    return fitted
+
+
+class Scatter(PMobject):
+    """Scatter plot of ``positions``, colored by ``labels``, fitted into a ``width`` by ``height`` box."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        positions: np.ndarray,
+        labels: np.ndarray,
+        *,
+        width: float = 6,
+        height: float = 6,
+        colors: tuple[str, ...] = SCAM_COLORS,
+        point_size: float = 2,
+        **kwargs: object,
+    ) -> None:
+        """Build the point cloud; ``point_size`` is the stroke width of every point."""
+        super().__init__(stroke_width=point_size, **kwargs)
+        palette = np.array([color_to_rgba(color) for color in colors])
+        self.points = fit_to_box(positions, width, height)
+        self.rgbas = palette[np.asarray(labels, dtype=int)]
+
+
+class EmbeddingEpochs(Animation):
+    """
+    Move the points of ``scatter`` through ``epochs``, the ``(epochs, n, 2)`` positions of its points.
+
+    Every epoch is fitted into the current bounding box of the scatter, and the run time is
+    split evenly between the epochs.
+    """
+
+    def __init__(self, scatter: Scatter, epochs: np.ndarray, **kwargs: object) -> None:
+        """Create the animation, with the keyword arguments of :class:`~manim.Animation`."""
+        self.epochs = np.asarray(epochs)
+        super().__init__(scatter, **kwargs)
+
+    def create_starting_mobject(self) -> Scatter:
+        """Skip the copy of the point cloud, the epochs hold every position."""
+        return self.mobject
+
+    def begin(self) -> None:
+        """Fit all epochs into the scatter's box at once."""
+        frames = fit_to_box(self.epochs, self.mobject.width, self.mobject.height)
+        self._frames = frames + self.mobject.get_center()
+        self.mobject.points = self._frames[0].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        """Interpolate all points between the two epochs around ``alpha``."""
+        if len(self._frames) == 1:
+            return
+        time = np.clip(self.rate_func(alpha), 0, 1) * (len(self._frames) - 1)
+        epoch = min(int(time), len(self._frames) - 2)
+        start, end = self._frames[epoch], self._frames[epoch + 1]
+        np.add(start, (time - epoch) * (end - start), out=self.mobject.points)
@@ -0,0 +1,138 @@
+"""
+Content-addressed slide segments.
+
+A presentation lists its slide methods in ``segments``. Every segment starts and ends on an
+empty scene, so it can be rendered as a scene of its own and stitched back together afterwards.
+Each segment is named after a digest of everything its video depends on, which makes an
+unchanged segment's rendered slides directly reusable. For localized scenes, that includes the
+catalog strings the segment uses but not the locale itself, so the segments of two locales
+showing the same strings share their renders. Slides declared in ``slides.toml`` count with
+their own entry only (see :mod:`deck.spec`).
+"""
+
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import sys
+import textwrap
+from dataclasses import dataclass
+from importlib.metadata import version
+from pathlib import Path
+
+from manim import config
+from manim_slides import Slide
+
+from deck.i18n import catalog_keys, translate
+from deck.profiles import ProfileFileWriter
+from deck.spec import load_specs, spec_names
+
+PACKAGE_DIR = Path(__file__).parent
+# Modules drawing the frames of every scene besides the ones it imports (see deck.render)
+RENDER_MODULES = ("renderer", "profiles")
+
+
+@dataclass(frozen=True)
+class Segment:
+    name: str
+    digest: str
+
+    @property
+    def scene_name(self) -> str:
+        """Name of the scene (and of its ``slides/*.json`` file) rendering this segment."""
+        return f"{self.name}_{self.digest[:12]}"
+
+
+def load_scene(file: Path, scene_name: str) -> type[Slide]:
+    """Import ``file`` as a module and return its ``scene_name`` class."""
+    module_name = file.stem
+    module = sys.modules.get(module_name)
+    if module is None or Path(module.__file__).resolve() != file.resolve():
+        spec = importlib.util.spec_from_file_location(module_name, file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def referenced_files(source: str) -> list[Path]:
+    """Return the existing files whose paths appear as string literals in ``source``."""
+    paths = {
+        node.value
+        for node in ast.walk(ast.parse(source))
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and "\n" not in node.value
+    }
+    return sorted(Path(path) for path in paths if len(path) < 256 and Path(path).is_file())  # noqa: PLR2004
+
+
+def package_imports(source: str, modules: tuple[str, ...] = ()) -> list[Path]:
+    """
+    Return the modules of this package that ``source`` imports, directly or through each other.
+
+    ``modules`` are names of modules of the package to include with their imports as well.
+    Build, export and other tooling modules never affect a rendered frame, so they are left out.
+    """
+    found = {PACKAGE_DIR / f"{name}.py" for name in modules}
+    pending = [source, *(module.read_text(encoding="utf-8") for module in found)]
+    while pending:
+        for node in ast.walk(ast.parse(pending.pop())):
+            if isinstance(node, ast.ImportFrom) and node.module:
+                names = [node.module]
+            elif isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            else:
+                continue
+            for name in names:
+                module = PACKAGE_DIR / f"{name.removeprefix(f'{PACKAGE_DIR.name}.')}.py"
+                if name.startswith(f"{PACKAGE_DIR.name}.") and module.is_file() and module not in found:
+                    found.add(module)
+                    pending.append(module.read_text(encoding="utf-8"))
+    return sorted(found)
+
+
+def shared_fingerprint(scene_cls: type[Slide]) -> bytes:
+    """Hash everything all segments of ``scene_cls`` depend on."""
+    # The defining module without the segment methods: imports, constants, construct, ...
+    scene_source = inspect.getsource(inspect.getmodule(scene_cls))
+    module_source = scene_source
+    for name in scene_cls.segments:
+        module_source = module_source.replace(inspect.getsource(getattr(scene_cls, name)), "")
+    digest = hashlib.sha256(module_source.encode())
+    for module in package_imports(scene_source, RENDER_MODULES):
+        digest.update(module.name.encode())
+        digest.update(module.read_bytes())
+    digest.update(f"manim=={version('manim')};manim-slides=={version('manim-slides')}".encode())
+    digest.update(f"{config.pixel_width}x{config.pixel_height}@{config.frame_rate}".encode())
+    digest.update(str(config.background_color).encode())
+    # Encoder options of the active profile (see deck.profiles), which change the videos too
+    digest.update(repr(ProfileFileWriter.encoder_options).encode())
+    return digest.digest()
+
+
+def segment_digest(scene_cls: type[Slide], name: str, shared: bytes) -> str:
+    """Hash the source of segment ``name``, the files, specs and strings it reads and the shared fingerprint."""
+    source = textwrap.dedent(inspect.getsource(getattr(scene_cls, name)))
+    digest = hashlib.sha256(shared)
+    digest.update(source.encode())
+    specs = [load_specs()[spec] for spec in spec_names(source)]
+    digest.update(repr(specs).encode())
+    if locale := getattr(scene_cls, "locale", None):
+        keys = catalog_keys(source) + [key for spec in specs for key in spec.string_keys()]
+        strings = {key: translate(locale, key) for key in keys}
+        digest.update(json.dumps(strings, sort_keys=True, ensure_ascii=False).encode())
+    for path in referenced_files(source):
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def collect_segments(scene_cls: type[Slide]) -> list[Segment]:
+    """Return the segments of ``scene_cls`` in presentation order."""
+    shared = shared_fingerprint(scene_cls)
+    return [Segment(name, segment_digest(scene_cls, name, shared)) for name in scene_cls.segments]
+
+
+def segment_scene(scene_cls: type[Slide], segment: Segment) -> type[Slide]:
+    """Create a scene class that only plays ``segment``."""
+    return type(segment.scene_name, (scene_cls,), {"segments": (segment.name,)})
@@ -0,0 +1,113 @@
+"""
+Price series for chart slides.
+
+Series are evaluated on whole NumPy grids and turned into a single :class:`~manim.VMobject`,
+so neither sampling nor plotting makes a Python call per point. The synthetic pump-and-dump
+curve uses a seeded generator, so every render draws the same curve.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from manim import Axes, VMobject
+
+OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+class PumpAndDumpSeries:
+    """
+    Synthetic price of a pump and dump scheme.
+
+    The price rises like a Gaussian until ``peak``, is dumped linearly afterwards and carries
+    a periodic and a uniform noise term of amplitude ``noise``.
+    """
+
+    def __init__(self, peak: float = 5, noise: float = 2, seed: int = 0) -> None:
+        """Configure the curve; ``seed`` fixes the uniform noise."""
+        self.peak = peak
+        self.noise = noise
+        self.seed = seed
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """Evaluate the price on all points of ``x`` at once."""
+        x = np.asarray(x, dtype=float)
+        pump = 5 + 90 * np.exp(-((x - self.peak) ** 2) / 2)
+        dump = np.maximum(0, 100 - 70 * (x - self.peak))
+        rng = np.random.default_rng(self.seed)
+        noise = self.noise * np.sin(3 * x) + self.noise * rng.uniform(-1, 1, x.shape)
+        return np.maximum(0, np.where(x < self.peak, pump, dump) + noise)
+
+    def sample(self, x_min: float, x_max: float, step: float) -> tuple[np.ndarray, np.ndarray]:
+        """Sample the price every ``step`` from ``x_min`` to ``x_max`` (included)."""
+        x = np.append(np.arange(x_min, x_max, step), x_max)
+        return x, self(x)
+
+
+def load_ohlcv(file: str | Path) -> dict[str, np.ndarray]:
+    """
+    Load OHLCV candles from ``file``, by column name.
+
+    ``.npz`` archives hold one array per column, and are read into memory. ``.csv`` files must
+    have a header and contain the columns of :data:`OHLCV_COLUMNS`, timestamps being Unix seconds.
+    """
+    file = Path(file)
+    if file.suffix == ".npz":
+        with np.load(file) as data:
+            return {column: data[column] for column in OHLCV_COLUMNS}
+
+    with file.open() as f:
+        header = f.readline().strip().split(",")
+    table = np.loadtxt(file, delimiter=",", skiprows=1, usecols=[header.index(column) for column in OHLCV_COLUMNS])
+    return dict(zip(OHLCV_COLUMNS, table.T, strict=True))
+
+
+def decimate(x: np.ndarray, y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to at most ``max_points`` points, keeping its visible shape.
+
+    The first and last points are kept, and the points between them are split in buckets of
+    which the minimum and maximum are kept, so spikes survive even when millions of points are
+    squeezed into one chart. The last bucket also takes the points left over by the others.
+
+    >>> x = np.arange(1999)
+    >>> x_kept, y_kept = decimate(x, np.sin(x), 100)
+    >>> len(x_kept) <= 100, int(x_kept[0]), int(x_kept[-1])
+    (True, 0, 1998)
+    """
+    buckets = (max_points - 2) // 2
+    if len(x) <= max_points or buckets <= 0:
+        return x, y
+    size = (len(x) - 2) // buckets
+    last_start = 1 + (buckets - 1) * size
+    y_buckets = y[1:last_start].reshape(buckets - 1, size)
+    y_last = y[last_start:-1]
+    picks = np.stack((y_buckets.argmin(axis=1), y_buckets.argmax(axis=1)), axis=1)
+    indices = np.unique(
+        np.concatenate(
+            (
+                [0],
+                (1 + np.arange(buckets - 1)[:, None] * size + picks).ravel(),
+                last_start + np.array([y_last.argmin(), y_last.argmax()]),
+                [len(x) - 1],
+            ),
+        ),
+    )
+    return x[indices], y[indices]
+
+
+def series_graph(
+    axes: Axes,
+    x: np.ndarray,
+    y: np.ndarray,
+    *,
+    smooth: bool = False,
+    **kwargs: object,
+) -> VMobject:
+    """Draw the series ``(x, y)`` on ``axes`` as a single :class:`~manim.VMobject`."""
+    points = np.asarray(axes.coords_to_point(x, y)).T
+    graph = VMobject(**kwargs)
+    if smooth:
+        graph.set_points_smoothly(points)
+    else:
+        graph.set_points_as_corners(points)
+    return graph
@@ -0,0 +1,111 @@
+"""
+Long-lived render server updating a preview of the presentation on every edit.
+
+Usage: ``python -m deck.serve [--profile NAME] [--locale LOCALE] [--interval SECONDS]``
+
+The server renders the presentation once, then polls the sources of the render stage (see
+:mod:`deck.build`) and renders again whenever one of them changes. Renders run in the server
+process, so manim, Pango's fonts and the in-memory caches of texts (:mod:`deck.text`) and
+compiled slide specs (:mod:`deck.spec`) stay warm, and segment digests (:mod:`deck.segments`)
+limit the work to the slides an edit touched. Each render is converted in-process into
+``.build/preview/<Presentation>.html``, which only has to be reloaded in the browser.
+
+``main.py``, the catalogs, ``slides.toml``, the result files and the corpus statistics are
+reloaded in place. An edit to the ``deck`` package or to ``manim.cfg`` restarts the server
+instead, since modules already imported by manim and the profile settings cannot be reloaded
+safely.
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+
+from manim import logger
+from manim_slides.config import PresentationConfig
+from manim_slides.convert import RevealJS
+
+from deck.assets import load_pixels
+from deck.build import LOCALE_SCENES, SCENE_FILE
+from deck.i18n import load_catalog
+from deck.profiles import get_profile
+from deck.render import render
+from deck.spec import load_specs
+
+PREVIEW_DIR = Path(".build/preview")
+# Sources only read when the server starts, see the module docstring
+RESTART_PATTERNS = ("deck/*.py", "manim.cfg")
+RELOAD_PATTERNS = (str(SCENE_FILE), "slides.toml", "locales/*.toml", "img/*", "results/*", "data/*.json")
+
+
+def snapshot() -> dict[Path, float]:
+    """Return the modification time of every watched file."""
+    files = (file for pattern in (*RESTART_PATTERNS, *RELOAD_PATTERNS) for file in Path().glob(pattern))
+    return {file: file.stat().st_mtime for file in files if file.is_file()}
+
+
+def changed_files(before: dict[Path, float], after: dict[Path, float]) -> list[Path]:
+    """Return the files added, removed or modified between two snapshots."""
+    return sorted(file for file in before.keys() | after.keys() if before.get(file) != after.get(file))
+
+
+def reload_sources() -> None:
+    """Forget the imported presentation, catalogs, specs and images, so the next render reads them again."""
+    sys.modules.pop(SCENE_FILE.stem, None)
+    load_catalog.cache_clear()
+    # Keyed on the file name, so an edited image would keep its old pixels
+    load_pixels.cache_clear()
+    load_specs.cache_clear()
+
+
+def preview(scene_name: str, profile_name: str) -> Path:
+    """Render the segments of ``scene_name`` that changed and convert the result to the preview HTML."""
+    start = time.perf_counter()
+    slides_file = render(SCENE_FILE, scene_name, profile=get_profile(profile_name))
+    html = PREVIEW_DIR / f"{scene_name}.html"
+    RevealJS(presentation_configs=[PresentationConfig.from_file(slides_file)]).convert_to(html)
+    logger.info("Preview '%s' updated in %.1fs", html, time.perf_counter() - start)
+    return html
+
+
+def serve(scene_name: str, profile_name: str, interval: float = 0.5) -> None:
+    """Keep the preview of ``scene_name`` up to date until interrupted."""
+    files = snapshot()
+    while True:
+        try:
+            preview(scene_name, profile_name)
+        except Exception:  # noqa: BLE001
+            # Half-written edits are expected, the next save gets another try
+            logger.exception("Render failed, waiting for the next change")
+        while not (changes := changed_files(files, snapshot())):
+            time.sleep(interval)
+        # Let editors finish writing, e.g. with "save all"
+        time.sleep(interval)
+        files = snapshot()
+        logger.info("Changed: %s", ", ".join(map(str, changes)))
+        if any(file.match(pattern) for file in changes for pattern in RESTART_PATTERNS):
+            logger.info("Restarting the server")
+            os.execv(sys.executable, [sys.executable, "-m", "deck.serve", *sys.argv[1:]])  # noqa: S606
+        reload_sources()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile", default="draft", help="Render profile defined in manim.cfg (default: draft).")
+    parser.add_argument(
+        "--locale",
+        choices=LOCALE_SCENES,
+        default=next(iter(LOCALE_SCENES)),
+        help="Language of the presentation (default: de).",
+    )
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between two polls (default: 0.5).")
+    args = parser.parse_args()
+    with contextlib.suppress(KeyboardInterrupt):
+        serve(LOCALE_SCENES[args.locale], args.profile, args.interval)
+
+
+if __name__ == "__main__":
+    main()
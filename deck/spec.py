@@ -0,0 +1,132 @@
+"""
+Declarative bullet-point slides.
+
+Slides made of a title in the upper left corner and columns of bullet points are described in
+``slides.toml`` instead of Python, with catalog keys (see :mod:`deck.i18n`) for their strings::
+
+    [idea]
+    title = "idea.title"
+    bullets = ["idea.pre_fraud_data", "idea.machine_learning"]
+
+    [discussion]
+    title = "discussion.title"
+    scale = 0.6
+    buff = 0.5
+
+    [[discussion.columns]]
+    heading = "discussion.results"
+    color = "BLUE"
+    bullets = ["discussion.no_classification"]
+
+The compiled mobjects of a spec are memoized by the spec and its strings, and the digest of a
+segment only covers the specs it plays, so editing one slide leaves the others cached.
+"""
+
+import ast
+import json
+import tomllib
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from functools import cache
+from pathlib import Path
+
+from manim import DOWN, LEFT, RIGHT, UL, Mobject, VGroup
+
+from deck.text import CachedText, text_defaults
+
+SPEC_FILE = Path(__file__).parent.parent / "slides.toml"
+# Name of the scene method playing a spec
+PLAY_METHOD = "spec_slide"
+
+
+@dataclass(frozen=True)
+class Column:
+    bullets: tuple[str, ...]
+    heading: str | None = None
+    color: str | None = None
+
+
+@dataclass(frozen=True)
+class SlideSpec:
+    title: str
+    columns: tuple[Column, ...]
+    # Scale of the bullet points and of the column headings
+    scale: float = 0.8
+    # Space between two bullet points
+    buff: float = 1
+    # Space between a column heading and its bullet points
+    heading_buff: float = 0.3
+    # Space between two columns
+    column_buff: float = 1
+
+    @classmethod
+    def from_table(cls, table: dict) -> "SlideSpec":
+        """Create a spec from its TOML table, where ``bullets`` is a shorthand for one column."""
+        table = dict(table)
+        columns = table.pop("columns", [])
+        if "bullets" in table:
+            columns = [{"bullets": table.pop("bullets")}, *columns]
+        return cls(
+            columns=tuple(Column(**{**column, "bullets": tuple(column["bullets"])}) for column in columns),
+            **table,
+        )
+
+    def string_keys(self) -> list[str]:
+        """Return the catalog keys of the spec's strings."""
+        keys = [self.title]
+        for column in self.columns:
+            keys.extend([column.heading] if column.heading else [])
+            keys.extend(column.bullets)
+        return keys
+
+
+@cache
+def load_specs(file: Path = SPEC_FILE) -> dict[str, SlideSpec]:
+    """Read the slide specs of ``file`` by name."""
+    with file.open("rb") as stream:
+        return {name: SlideSpec.from_table(table) for name, table in tomllib.load(stream).items()}
+
+
+def spec_names(source: str) -> list[str]:
+    """Return the specs played with ``self.spec_slide("...")`` in ``source``."""
+    return sorted(
+        {
+            node.args[0].value
+            for node in ast.walk(ast.parse(source))
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == PLAY_METHOD
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+        },
+    )
+
+
+_compiled: dict[str, tuple[Mobject, Mobject]] = {}
+
+
+def compile_spec(spec: SlideSpec, tr: Callable[[str], str]) -> tuple[Mobject, Mobject]:
+    """
+    Build the title and the body of ``spec``, looking its strings up with ``tr``.
+
+    Returned mobjects are copies of memoized ones, so they can be animated freely.
+    """
+    strings = {key: tr(key) for key in spec.string_keys()}
+    key = json.dumps([asdict(spec), strings, text_defaults()], sort_keys=True, default=str, ensure_ascii=False)
+    if key not in _compiled:
+        title = CachedText(strings[spec.title]).to_edge(UL)
+        columns = []
+        for column in spec.columns:
+            bullets = VGroup(*(CachedText(strings[bullet]).scale(spec.scale) for bullet in column.bullets)).arrange(
+                DOWN,
+                aligned_edge=LEFT,
+                buff=spec.buff,
+            )
+            if column.heading:
+                color = {"color": column.color} if column.color else {}
+                heading = CachedText(strings[column.heading], **color).scale(spec.scale)
+                bullets = VGroup(heading, bullets).arrange(DOWN, aligned_edge=LEFT, buff=spec.heading_buff)
+            columns.append(bullets)
+        body = columns[0] if len(columns) == 1 else VGroup(*columns).arrange(RIGHT, buff=spec.column_buff)
+        _compiled[key] = (title, body)
+    return tuple(mobject.copy() for mobject in _compiled[key])
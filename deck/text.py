@@ -0,0 +1,112 @@
+"""
+Cached :class:`~manim.Text` construction.
+
+Shaping a string with Pango and parsing the resulting SVG dominates scene setup, while most
+strings of the deck (coin names, table headers, titles, ...) are built many times. Glyph
+outlines are therefore kept in an in-memory LRU and persisted as ``.npz`` files next to
+manim's own text SVGs, so a repeated string is a deep copy and a new run skips Pango entirely.
+"""
+
+import hashlib
+import itertools
+import json
+import tempfile
+from collections import OrderedDict
+from functools import partialmethod
+from importlib.metadata import version
+from pathlib import Path
+
+import numpy as np
+from manim import Text, VGroup, VMobject, config
+
+MAX_CACHED_TEXTS = 512
+
+_glyphs: OrderedDict[str, list[VMobject]] = OrderedDict()
+
+
+def text_defaults() -> dict[str, object]:
+    """Return the keyword arguments set with ``Text.set_default``."""
+    defaults: dict[str, object] = {}
+    init = Text.__dict__.get("__init__")
+    while isinstance(init, partialmethod):
+        defaults = {**init.keywords, **defaults}
+        init = getattr(init.func, "_partialmethod", None)
+    return defaults
+
+
+def _cache_key(text: str, kwargs: dict[str, object]) -> str:
+    settings = {**text_defaults(), **kwargs, "manim": version("manim")}
+    return json.dumps([text, settings], sort_keys=True, default=str, ensure_ascii=False)
+
+
+def _cache_file(key: str) -> Path:
+    return config.get_dir("text_dir") / f"{hashlib.sha256(key.encode()).hexdigest()}.npz"
+
+
+def _save(glyphs: list[VMobject], file: Path) -> None:
+    file.parent.mkdir(parents=True, exist_ok=True)
+    # Workers may shape the same string concurrently: write aside and rename, so that nobody
+    # loads a partially written archive
+    with tempfile.NamedTemporaryFile(dir=file.parent, suffix=".tmp", delete=False) as stream:
+        np.savez(
+            stream,
+            points=np.concatenate([glyph.points for glyph in glyphs]),
+            offsets=np.cumsum([0] + [len(glyph.points) for glyph in glyphs]),
+            fill=np.array([glyph.fill_rgbas[0] for glyph in glyphs]),
+            stroke=np.array([glyph.stroke_rgbas[0] for glyph in glyphs]),
+            stroke_width=np.array([glyph.stroke_width for glyph in glyphs]),
+        )
+    Path(stream.name).replace(file)
+
+
+def _load(file: Path) -> list[VMobject]:
+    data = np.load(file)
+    offsets = data["offsets"]
+    glyphs = []
+    for index, (start, stop) in enumerate(itertools.pairwise(offsets)):
+        glyph = VMobject(stroke_width=float(data["stroke_width"][index]))
+        glyph.points = data["points"][start:stop]
+        glyph.fill_rgbas = data["fill"][index : index + 1]
+        glyph.stroke_rgbas = data["stroke"][index : index + 1]
+        glyphs.append(glyph)
+    return glyphs
+
+
+def _get_glyphs(text: str, kwargs: dict[str, object]) -> list[VMobject]:
+    key = _cache_key(text, kwargs)
+    if key in _glyphs:
+        _glyphs.move_to_end(key)
+        return _glyphs[key]
+
+    file = _cache_file(key)
+    # Gradients are not a single color per glyph, they only get the in-memory cache
+    persist = "gradient" not in kwargs and "t2g" not in kwargs
+    if persist and file.exists():
+        glyphs = _load(file)
+    else:
+        glyphs = Text(text, **kwargs).family_members_with_points()
+        if persist:
+            _save(glyphs, file)
+
+    _glyphs[key] = glyphs
+    if len(_glyphs) > MAX_CACHED_TEXTS:
+        _glyphs.popitem(last=False)
+    return glyphs
+
+
+class CachedText(VGroup):
+    """
+    Drop-in replacement for :class:`~manim.Text` reusing previously shaped strings.
+
+    Accepts the same arguments as :class:`~manim.Text`, including the defaults set with
+    ``Text.set_default``, and holds one submobject per glyph outline.
+    """
+
+    def __init__(self, text: str, **kwargs: object) -> None:
+        """Copy the glyphs of ``text`` from the cache, shaping it first if needed."""
+        super().__init__(*(glyph.copy() for glyph in _get_glyphs(text, kwargs)))
+        self.text = text
+
+    def __repr__(self) -> str:
+        """Represent like :class:`~manim.Text`."""
+        return f"CachedText({self.text!r})"
@@ -0,0 +1,120 @@
+"""
+Opt-in tracing of slide rendering, written as a Chrome trace.
+
+A :class:`Tracer` attached to a scene times every slide segment, ``play``, ``wait`` and
+``next_slide`` call, and, for every frame, the interpolation of the animations, the
+rasterization by Cairo and the write to ffmpeg's pipe. Time spent in a segment outside of
+those calls is reported as mobject construction. The resulting file opens in
+``chrome://tracing``, Perfetto or speedscope.
+"""
+
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+
+from manim_slides import Slide
+
+COMMENT = re.compile(r"^\s*#\s*(.+?)\s*$", re.MULTILINE)
+
+
+def slide_label(scene_cls: type[Slide], segment: str) -> str:
+    """
+    Return the label of ``segment``: its first comment, up to a colon.
+
+    E.g. ``# Pump and Dump Scheme Visualization: Create animated price chart`` gives
+    ``Pump and Dump Scheme Visualization``.
+    """
+    match = COMMENT.search(inspect.getsource(getattr(scene_cls, segment)))
+    return match.group(1).split(":")[0] if match else segment
+
+
+class Tracer:
+    """Collect trace events of one scene."""
+
+    def __init__(self) -> None:
+        """Start an empty trace."""
+        self.events: list[dict] = []
+        self._pid = os.getpid()
+        self._tid = threading.get_ident()
+        self._construct_start: float | None = None
+
+    @staticmethod
+    def _now() -> float:
+        return time.perf_counter_ns() / 1000
+
+    def _add(self, name: str, category: str, start: float, end: float, **args: object) -> None:
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start,
+                "dur": end - start,
+                "pid": self._pid,
+                "tid": self._tid,
+                "args": args,
+            },
+        )
+
+    def _end_construct(self) -> None:
+        if self._construct_start is not None:
+            self._add("construct mobjects", "construct", self._construct_start, self._now())
+            self._construct_start = None
+
+    def wrap(self, function: Callable, name: str, category: str, *, construct: bool = False) -> Callable:
+        """
+        Wrap ``function`` to record a trace event each time it is called.
+
+        With ``construct``, the time spent between two such calls is recorded as mobject
+        construction.
+        """
+
+        @wraps(function)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            if construct:
+                self._end_construct()
+            start = self._now()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._add(name, category, start, self._now())
+                if construct:
+                    self._construct_start = self._now()
+
+        return wrapper
+
+    def attach(self, scene: Slide) -> None:
+        """Instrument ``scene``, which must already be initialized."""
+        for segment in getattr(scene, "segments", ()):
+            method = getattr(scene, segment)
+            label = slide_label(type(scene), segment)
+
+            def traced(method: Callable = method, label: str = label) -> None:
+                self._construct_start = self._now()
+                start = self._now()
+                try:
+                    method()
+                finally:
+                    self._end_construct()
+                    self._add(label, "slide", start, self._now())
+
+            setattr(scene, segment, traced)
+
+        for name in ("play", "wait", "next_slide"):
+            setattr(scene, name, self.wrap(getattr(scene, name), name, "scene", construct=True))
+        scene.update_to_time = self.wrap(scene.update_to_time, "interpolate", "frame")
+        scene.renderer.update_frame = self.wrap(scene.renderer.update_frame, "rasterize", "frame")
+        file_writer = scene.renderer.file_writer
+        file_writer.write_frame = self.wrap(file_writer.write_frame, "ffmpeg pipe", "frame")
+        file_writer.end_animation = self.wrap(file_writer.end_animation, "ffmpeg finish", "encode")
+
+
+def write_trace(events: list[dict], file: Path) -> None:
+    """Write ``events`` in the Chrome trace event format."""
+    file.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
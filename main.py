@@ -1,54 +1,136 @@
 from manim import *
 from manim_slides import Slide
 
+from deck.animations import BatchedFadeOut
+from deck.assets import SharedImage
+from deck.components import ResultsTable
+from deck.corpus import STATS_FILE, CorpusChart, CorpusStats
+from deck.i18n import translate
+from deck.metrics import load_scores
+from deck.series import PumpAndDumpSeries, series_graph
+from deck.spec import compile_spec, load_specs
+from deck.text import CachedText
+
+# Coins of the dataset splits, by label
+TRAIN_COINS = ["Avalanche", "Bitcoin", "Chainlink", "THORChain", "BeerCoin", "BitForex", "Terra Luna"]
+TEST_COINS = ["Cosmos", "Ethereum", "Safe Moon", "FTX Token"]
+SCAM_COINS = {"BeerCoin", "BitForex", "Terra Luna", "Safe Moon", "FTX Token"}
+
 
 class Presentation(Slide):
     # TODO: Look if the presentation reaches 15min
     # TODO: Look if I can host with GitHub Pages
 
-    def construct(self):
-        # Title Slide: Show main presentation title with author
+    # String catalog of the deck, see locales/*.toml
+    locale = "de"
+
+    # Slide segments in presentation order. Every segment starts and ends on an empty
+    # scene, so each one can be rendered and cached on its own (see deck/segments.py).
+    segments = (
+        "title_slide",
+        "introduction_slide",
+        "pump_and_dump_title_slide",
+        "pump_and_dump_slide",
+        "idea_slide",
+        "why_reddit_slide",
+        "scraping_slide",
+        "data_slide",
+        # Only once the corpus statistics were aggregated, see deck/corpus.py
+        *(("corpus_slide",) if STATS_FILE.exists() else ()),
+        "train_test_split_slide",
+        "cross_validation_slide",
+        "mnb_slide",
+        "mnb_results_slide",
+        "svc_slide",
+        "svc_results_slide",
+        "gat_slide",
+        "gat_results_slide",
+        "discussion_slide",
+        "thank_you_slide",
+    )
 
-        # set default text font
+    def construct(self):
+        # set default text font. Every call wraps Text.__init__ once more, so reset it first:
+        # the preview server (deck/serve.py) constructs scenes again and again in one process.
+        Text.set_default()
         Text.set_default(font="Times New Roman", warn_missing_font=True)
 
+        for segment in self.segments:
+            getattr(self, segment)()
+
+    def tr(self, key: str) -> str:
+        # Look up a string of the deck's locale, e.g. self.tr("title.subtitle")
+        return translate(self.locale, key)
+
+    def clear_slide(self, **kwargs: object) -> None:
+        # Fade out everything on screen with a single animation (see deck/animations.py)
+        self.play(BatchedFadeOut(*self.mobjects, **kwargs))
+
+    def spec_slide(self, name: str) -> None:
+        # Bullet-point slide declared in slides.toml: title, bullet points, pause, fade out
+        title, body = compile_spec(load_specs()[name], self.tr)
+        self.play(Write(title))
+        self.play(Write(body))
+        self.next_slide()
+        self.clear_slide()
+
+    def results_slide(self, title: str, file: str, splits: dict[str, list[str]]) -> None:
+        # Results table of the accuracies in an experiment's result file (see deck/metrics.py).
+        # The title is looked up by the segment, so its string is part of the segment's digest.
+        title = CachedText(title).to_corner(UL)
+        table = ResultsTable(load_scores(file), splits, scam=SCAM_COINS)
+
+        self.play(Write(title))
+        self.play(FadeIn(table))
+        self.next_slide()
+        self.clear_slide()
+
+    def title_slide(self):
+        # Title Slide: Show main presentation title with author
         title = VGroup(
-            Text("Betrugserkennung bei Kryptowährungen", t2c={"Betrugserkennung": RED}),
-            Text("mit Reddit-Daten", t2c={"Reddit": ORANGE}),
-            Text(
-                "von Gabriel Torres Gamez",
+            CachedText(self.tr("title.title"), t2c={self.tr("title.title_highlight"): RED}),
+            CachedText(self.tr("title.subtitle"), t2c={"Reddit": ORANGE}),
+            CachedText(
+                self.tr("title.author"),
                 color=GREY,
             ).scale(0.5),
         ).arrange(DOWN)
 
         self.play(FadeIn(title))
         self.next_slide()
-        self.play(FadeOut(title))
+        self.clear_slide()
 
+    def introduction_slide(self):
         # Introduction Slide: Present FTC statistics about cryptocurrency fraud
         introduction = VGroup(
-            Text("Laut einer Analyse"),
-            Text("der Federal Trade Commission,"),
-            Text("verloren Verbraucher über", t2c={"verloren": RED}),
-            Text("$1 Milliarde", color=RED).scale(2),
-            Text("durch Kryptowährungsbetrug"),
-            Text("zwischen Januar 2021 und März 2022.", t2c={"Januar 2021": BLUE, "März 2022": BLUE}),
-            Text(
+            CachedText(self.tr("introduction.according_to")),
+            CachedText(self.tr("introduction.ftc")),
+            CachedText(self.tr("introduction.lost"), t2c={self.tr("introduction.lost_highlight"): RED}),
+            CachedText(self.tr("introduction.amount"), color=RED).scale(2),
+            CachedText(self.tr("introduction.fraud")),
+            CachedText(
+                self.tr("introduction.period"),
+                t2c={self.tr("introduction.period_start"): BLUE, self.tr("introduction.period_end"): BLUE},
+            ),
+            CachedText(
                 "«New Analysis Finds Consumers Reported Losing More than $1 Billion in Cryptocurrency to Scams since 2021»,",
                 color=GREY,
             ).scale(0.4),
-            Text("(2022, Juni 3). Federal Trade Commission.", color=GREY).scale(0.4),
+            CachedText(self.tr("introduction.source_date"), color=GREY).scale(0.4),
         ).arrange(DOWN)
 
         self.play(Write(introduction))
         self.next_slide()
-        self.play(FadeOut(introduction))
+        self.clear_slide()
 
-        # Pump and Dump Scheme Visualization: Create animated price chart
-        title = Text("Pump and Dump Schema")
+    def pump_and_dump_title_slide(self):
+        # Localized title, in a segment of its own so the chart is shared between locales
+        title = CachedText(self.tr("pump_and_dump.title"))
         self.play(Write(title))
-        self.play(FadeOut(title))
+        self.clear_slide()
 
+    def pump_and_dump_slide(self):
+        # Pump and Dump Scheme Visualization: Create animated price chart
         # Set up coordinate system for price chart
         axes = Axes(
             x_range=[0, 10, 1],
@@ -57,25 +139,14 @@ class Presentation(Slide):
         )
         axes_labels = axes.get_axis_labels(x_label="t", y_label=r"\$")
 
-        # Create pump and dump price function with noise
-        def noisy_pump_and_dump(x):
-            # Simulate price pump until x=5, then dump
-            base = 5 + 90 * np.exp(-((x - 5) ** 2) / 2) if x < 5 else max(0, 100 - 70 * (x - 5))
-            # Add random noise for realism
-            noise = 2 * np.sin(3 * x) + 2 * np.random.uniform(-1, 1)
-            return max(0, base + noise)
-
-        price_graph = axes.plot(
-            noisy_pump_and_dump,
-            x_range=[0, 9.5],
-            color=RED,
-            use_smoothing=True,
-        )
+        # Sample the pump and dump price with fixed noise, so every render draws the same curve
+        x, price = PumpAndDumpSeries(peak=5, seed=0).sample(0, 9.5, 1)
+        price_graph = series_graph(axes, x, price, smooth=True, color=RED)
 
         # Add labels for key phases of pump and dump
-        insider_pump_label = Text("Insiders Pump").next_to(axes.c2p(0.7, 30)).scale(0.5)
-        others_pump_label = Text("Others Pump").next_to(axes.c2p(1.7, 70)).scale(0.5)
-        dump_label = Text("Dump").next_to(axes.c2p(4.75, 90)).scale(0.5)
+        insider_pump_label = CachedText("Insiders Pump").next_to(axes.c2p(0.7, 30)).scale(0.5)
+        others_pump_label = CachedText("Others Pump").next_to(axes.c2p(1.7, 70)).scale(0.5)
+        dump_label = CachedText("Dump").next_to(axes.c2p(4.75, 90)).scale(0.5)
 
         # Animate the price chart elements
         self.play(Create(axes), Write(axes_labels))
@@ -87,60 +158,36 @@ class Presentation(Slide):
         )
 
         self.next_slide()
-        self.play(
-            FadeOut(axes),
-            FadeOut(axes_labels),
-            FadeOut(price_graph),
-            FadeOut(insider_pump_label),
-            FadeOut(others_pump_label),
-            FadeOut(dump_label),
-        )
+        self.clear_slide()
 
+    def idea_slide(self):
         # IDEA SLIDE
-        idea_title = Text("Idee").to_edge(UL)
-        idea_points = VGroup(
-            Text("Modelle mit Vor-Betrugs-Daten trainieren").scale(0.8),
-            Text("Betrug mit Machine Learning erkennen").scale(0.8),
-            Text("Graph- und traditionelle Modelle vergleichen").scale(0.8),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=1)
-
-        self.play(Write(idea_title))
-        self.play(Write(idea_points))
-        self.next_slide()
-        self.play(FadeOut(idea_title), FadeOut(idea_points))
+        self.spec_slide("idea")
 
+    def why_reddit_slide(self):
         # WHY REDDIT SLIDE
-        reddit_title = Text("Warum Reddit?").to_edge(UL)
-        reddit_points = VGroup(
-            Text("Hierarchische Daten für Graphen").scale(0.8),
-            Text("Vermutlich wertvolle Verbindungen").scale(0.8),
-            Text("Viele Diskussionen").scale(0.8),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=1)
-
-        self.play(Write(reddit_title))
-        self.play(Write(reddit_points))
-        self.next_slide()
-        self.play(FadeOut(reddit_title), FadeOut(reddit_points))
+        self.spec_slide("why_reddit")
 
+    def scraping_slide(self):
         # Data Scraping Process: Show workflow from Google to Reddit to Elasticsearch
-        title = Text("Scraping").to_edge(UL)
+        title = CachedText("Scraping").to_edge(UL)
 
         search_query = (
-            Text("FTX Token site:reddit.com/r/CryptoCurrency after:2019-08-01 before:2022-11-07", color=GREY)
+            CachedText("FTX Token site:reddit.com/r/CryptoCurrency after:2019-08-01 before:2022-11-07", color=GREY)
             .scale(0.5)
             .shift(UP * 1.5)
         )
         rectangle = SurroundingRectangle(search_query, color=GREY, buff=0.3)
 
-        google_logo = ImageMobject("img/google_logo.png").scale(0.55).to_edge(LEFT).shift(DOWN * 0.7).shift(RIGHT * 0.5)
-        reddit_logo = ImageMobject("img/reddit_logo.png").scale(0.55).shift(DOWN * 0.7)
+        google_logo = SharedImage("img/google_logo.png").scale(0.55).to_edge(LEFT).shift(DOWN * 0.7).shift(RIGHT * 0.5)
+        reddit_logo = SharedImage("img/reddit_logo.png").scale(0.55).shift(DOWN * 0.7)
         elastic_logo = (
-            ImageMobject("img/elasticsearch_logo.png").scale(0.55).to_edge(RIGHT).shift(DOWN * 0.7).shift(LEFT * 0.5)
+            SharedImage("img/elasticsearch_logo.png").scale(0.55).to_edge(RIGHT).shift(DOWN * 0.7).shift(LEFT * 0.5)
         )
 
-        google_label = Text("Suche nach Reddit-Beiträgen").next_to(google_logo, DOWN).scale(0.4)
-        reddit_label = Text("Datenextraktion mit praw").next_to(reddit_logo, DOWN).scale(0.4)
-        elastic_label = Text("Datenspeicherung in Elasticsearch").next_to(elastic_logo, DOWN).scale(0.4)
+        google_label = CachedText(self.tr("scraping.google")).next_to(google_logo, DOWN).scale(0.4)
+        reddit_label = CachedText(self.tr("scraping.reddit")).next_to(reddit_logo, DOWN).scale(0.4)
+        elastic_label = CachedText(self.tr("scraping.elastic")).next_to(elastic_logo, DOWN).scale(0.4)
 
         arrow = Arrow(google_logo, reddit_logo).shift(DOWN * 1)
         arrow2 = Arrow(reddit_logo, elastic_logo).shift(DOWN * 1)
@@ -160,46 +207,48 @@ class Presentation(Slide):
         self.play(Create(arrow2))
 
         self.next_slide()
-        self.play(
-            FadeOut(title),
-            FadeOut(search_query),
-            FadeOut(rectangle),
-            FadeOut(google_logo),
-            FadeOut(reddit_logo),
-            FadeOut(elastic_logo),
-            FadeOut(google_label),
-            FadeOut(reddit_label),
-            FadeOut(elastic_label),
-            FadeOut(arrow),
-            FadeOut(arrow2),
-        )
+        self.clear_slide()
 
+    def data_slide(self):
         # Data Structure: Show Reddit data schema
-        title = Text("Daten").to_edge(UL)
-        reddit_structure = ImageMobject("img/reddit_structure.png").scale(0.8)
+        title = CachedText(self.tr("data.title")).to_edge(UL)
+        reddit_structure = SharedImage("img/reddit_structure.png").scale(0.8)
         reddit_structure.set_resampling_algorithm(RESAMPLING_ALGORITHMS["lanczos"])
 
         self.play(Write(title))
         self.play(FadeIn(reddit_structure))
 
         self.next_slide()
-        self.play(FadeOut(title), FadeOut(reddit_structure))
+        self.clear_slide()
+
+    def corpus_slide(self):
+        # Corpus Statistics: documents per coin and activity per day of the scraped data
+        title = CachedText(self.tr("corpus.title")).to_edge(UL)
+        chart = CorpusChart(CorpusStats.load("data/corpus_stats.json"), width=11, height=3.5)
+        chart.next_to(title, DOWN, buff=0.6).set_x(0)
 
+        self.play(Write(title))
+        self.play(FadeIn(chart))
+
+        self.next_slide()
+        self.clear_slide()
+
+    def train_test_split_slide(self):
         # Train-Test Split: Display cryptocurrency dataset division
 
         coin_image_size = 0.25
         coin_name_size = 0.4
         group_title_size = 0.5
 
-        ts_title = Text("Train - Test Split").to_edge(UL)
+        ts_title = CachedText("Train - Test Split").to_edge(UL)
         self.play(Write(ts_title))
 
         # Create train set non-scam coins
         train_non_scam_items = Group(
             *[
                 Group(
-                    ImageMobject("img/coin.png").scale(coin_image_size),
-                    Text(name).scale(coin_name_size),
+                    SharedImage("img/coin.png").scale(coin_image_size),
+                    CachedText(name).scale(coin_name_size),
                 ).arrange(DOWN, buff=0.1)
                 for name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain"]
             ],
@@ -209,8 +258,8 @@ class Presentation(Slide):
         train_scam_items = Group(
             *[
                 Group(
-                    ImageMobject("img/coin.png").scale(coin_image_size),
-                    Text(name).scale(coin_name_size),
+                    SharedImage("img/coin.png").scale(coin_image_size),
+                    CachedText(name).scale(coin_name_size),
                 ).arrange(DOWN, buff=0.1)
                 for name in ["BeerCoin", "BitForex", "Terra Luna"]
             ],
@@ -220,8 +269,8 @@ class Presentation(Slide):
         test_non_scam_items = Group(
             *[
                 Group(
-                    ImageMobject("img/coin.png").scale(coin_image_size),
-                    Text(name).scale(coin_name_size),
+                    SharedImage("img/coin.png").scale(coin_image_size),
+                    CachedText(name).scale(coin_name_size),
                 ).arrange(DOWN, buff=0.1)
                 for name in ["Cosmos", "Ethereum"]
             ],
@@ -231,8 +280,8 @@ class Presentation(Slide):
         test_scam_items = Group(
             *[
                 Group(
-                    ImageMobject("img/coin.png").scale(coin_image_size),
-                    Text(name).scale(coin_name_size),
+                    SharedImage("img/coin.png").scale(coin_image_size),
+                    CachedText(name).scale(coin_name_size),
                 ).arrange(DOWN, buff=0.1)
                 for name in ["Safe Moon", "FTX Token"]
             ],
@@ -240,22 +289,22 @@ class Presentation(Slide):
 
         # Group coins by category
         train_non_scam_group = Group(
-            Text("Train Nicht-Betrug").scale(group_title_size),
+            CachedText(self.tr("train_test_split.train_non_scam")).scale(group_title_size),
             train_non_scam_items,
         ).arrange(DOWN, buff=0.3)
 
         train_scam_group = Group(
-            Text("Train Betrug").scale(group_title_size),
+            CachedText(self.tr("train_test_split.train_scam")).scale(group_title_size),
             train_scam_items,
         ).arrange(DOWN, buff=0.3)
 
         test_non_scam_group = Group(
-            Text("Test Nicht-Betrug").scale(group_title_size),
+            CachedText(self.tr("train_test_split.test_non_scam")).scale(group_title_size),
             test_non_scam_items,
         ).arrange(DOWN, buff=0.3)
 
         test_scam_group = Group(
-            Text("Test Betrug").scale(group_title_size),
+            CachedText(self.tr("train_test_split.test_scam")).scale(group_title_size),
             test_scam_items,
         ).arrange(DOWN, buff=0.3)
 
@@ -269,8 +318,8 @@ class Presentation(Slide):
         # Add dataset statistics
         explanation_text = (
             Group(
-                Text("Train Set (7 Coins): 4 Nicht-Betrug, 3 Betrug").scale(0.5),
-                Text("Test Set (4 Coins): 2 Nicht-Betrug, 2 Betrug").scale(0.5),
+                CachedText(self.tr("train_test_split.train_summary")).scale(0.5),
+                CachedText(self.tr("train_test_split.test_summary")).scale(0.5),
             )
             .arrange(DOWN, aligned_edge=LEFT, buff=0.1)
             .to_edge(DOWN)
@@ -278,20 +327,20 @@ class Presentation(Slide):
         self.play(FadeIn(explanation_text))
 
         self.next_slide()
-        self.play(
-            FadeOut(ts_title),
-            FadeOut(main_group),
-            FadeOut(explanation_text),
-        )
+        self.clear_slide()
 
+    def cross_validation_slide(self):
         # Training Methodology: Show cross-validation process
-        tm_title = Text("Trainingsmethodik").to_edge(UL)
+        tm_title = CachedText(self.tr("cross_validation.title")).to_edge(UL)
         self.play(Write(tm_title))
 
         # Create coin groups for cross-validation
         coin_image_size = 0.2
         coins = [
-            Group(ImageMobject("img/coin.png").scale(coin_image_size), Text(name).scale(0.4)).arrange(DOWN, buff=0.1)
+            Group(SharedImage("img/coin.png").scale(coin_image_size), CachedText(name).scale(0.4)).arrange(
+                DOWN,
+                buff=0.1,
+            )
             for name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain", "BeerCoin", "BitForex", "Terra Luna"]
         ]
 
@@ -303,8 +352,11 @@ class Presentation(Slide):
         ).set_opacity(0)
 
         # Arrange cross-validation groups
-        fitting_group = Group(Text("Fitting Set").scale(0.5), all_coins_group).arrange(RIGHT, buff=0.8)
-        validation_group = Group(Text("Validation Set").scale(0.5), validation_placeholder).arrange(RIGHT, buff=0.8)
+        fitting_group = Group(CachedText("Fitting Set").scale(0.5), all_coins_group).arrange(RIGHT, buff=0.8)
+        validation_group = Group(CachedText("Validation Set").scale(0.5), validation_placeholder).arrange(
+            RIGHT,
+            buff=0.8,
+        )
         main_group = Group(fitting_group, validation_group).arrange(DOWN, buff=0.5)
 
         self.play(FadeIn(main_group))
@@ -323,214 +375,48 @@ class Presentation(Slide):
         self.play(coins[-1].animate.shift(UP * 1.5))
 
         self.next_slide()
-        self.play(FadeOut(main_group), FadeOut(tm_title))
+        self.clear_slide()
 
+    def mnb_slide(self):
         # Multinomial Naive Bayes
-        mnb_title = Text("Multinomial Naive Bayes (Baseline)").to_edge(UL)
-        mnb_points = VGroup(
-            Text("Simpelste Modell").scale(0.8),
-            Text("Identifiziert scamtypische Wörter").scale(0.8),
-            Text("Nimmt Unabhängigkeit zwischen Features an").scale(0.8),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=1)
-
-        self.play(Write(mnb_title))
-        self.play(Write(mnb_points))
-        self.next_slide()
-        self.play(FadeOut(mnb_title), FadeOut(mnb_points))
+        self.spec_slide("mnb")
 
+    def mnb_results_slide(self):
         # Results slide
-        title_size = 1
-        header_size = 0.7
-        coin_name_size = 0.7
-        score_size = 0.7
-        title_buff = 0.2
-        column_buff = 1
-        group_buff = 2
-
-        title = Text("Metriken").scale(title_size).to_corner(UL)
-
-        # Keep scores dictionary as is - these are numbers
-        scores = {
-            "Avalanche": 1,
-            "Bitcoin": 1,
-            "Chainlink": 1,
-            "THORChain": 1,
-            "BeerCoin": 0.81,
-            "BitForex": 0,
-            "Terra Luna": 0,
-            "Cosmos": 1,
-            "Ethereum": 1,
-            "Safe Moon": 0,
-            "FTX Token": 0,
-        }
-
-        # Vertical groups for train set
-        train_coin_names = Group(
-            Text("Coin", color=GREY).scale(header_size),  # Header
-            *[
-                Text(name, color=GREEN if name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain"] else RED).scale(
-                    coin_name_size,
-                )
-                for name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain", "BeerCoin", "BitForex", "Terra Luna"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        train_scores = Group(
-            Text("Accuracy", color=GREY).scale(header_size),  # Header
-            *[
-                Text(
-                    f"{scores[name]}",
-                    color=GREEN if name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain"] else RED,
-                ).scale(score_size)
-                for name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain", "BeerCoin", "BitForex", "Terra Luna"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        # Vertical groups for test set
-        test_coin_names = Group(
-            Text("Coin", color=GREY).scale(header_size),  # Header
-            *[
-                Text(name, color=GREEN if name in ["Cosmos", "Ethereum"] else RED).scale(coin_name_size)
-                for name in ["Cosmos", "Ethereum", "Safe Moon", "FTX Token"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        test_scores = Group(
-            Text("Accuracy", color=GREY).scale(header_size),  # Header
-            *[
-                Text(f"{scores[name]}", color=GREEN if name in ["Cosmos", "Ethereum"] else RED).scale(score_size)
-                for name in ["Cosmos", "Ethereum", "Safe Moon", "FTX Token"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        # Combine train and test groups
-        train_group = Group(
-            Text("Train Set").scale(header_size),
-            Group(train_coin_names, train_scores).arrange(RIGHT, buff=column_buff),
-        ).arrange(DOWN, buff=title_buff)
-
-        test_group = Group(
-            Text("Test Set").scale(header_size),
-            Group(test_coin_names, test_scores).arrange(RIGHT, buff=column_buff),
-        ).arrange(DOWN, buff=title_buff)
-
-        main_group = Group(train_group, test_group).arrange(RIGHT, buff=group_buff)
-
-        self.play(Write(title))
-        self.play(FadeIn(main_group))
-        self.next_slide()
-        self.play(FadeOut(main_group), FadeOut(title))
+        self.results_slide(
+            self.tr("results.title"),
+            "results/mnb.csv",
+            {"Train Set": TRAIN_COINS, "Test Set": TEST_COINS},
+        )
 
+    def svc_slide(self):
         # Linear Support Vector Classifier
-        svc_title = Text("Linear Support Vector Classifier").to_edge(UL)
-        svc_points = VGroup(
-            Text("Maximiert Margin zwischen Klassen").scale(0.8),
-            Text("Effektiv für linear trennbare Daten").scale(0.8),
-            Text("Benötigt numerische Eingabe -> BERT").scale(0.8),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=1)
-
-        self.play(Write(svc_title))
-        self.play(Write(svc_points))
-        self.next_slide()
-        self.play(FadeOut(svc_title), FadeOut(svc_points))
-
-        # Results slide (metrics remain the same)
-        title_size = 1
-        header_size = 0.7
-        coin_name_size = 0.7
-        score_size = 0.7
-        title_buff = 0.2
-        column_buff = 1
-        group_buff = 2
-
-        title = Text("Metriken").scale(title_size).to_corner(UL)
-
-        scores = {
-            "Avalanche": 0.528,
-            "Bitcoin": 0.545,
-            "Chainlink": 0.515,
-            "THORChain": 0.507,
-            "BeerCoin": 0.595,
-            "BitForex": 0.65,
-            "Terra Luna": 0.365,
-            "Cosmos": 0.5074,
-            "Ethereum": 0.649,
-            "Safe Moon": 0.395,
-            "FTX Token": 0.428,
-        }
-
-        # Vertical groups for train set
-        train_coin_names = Group(
-            Text("Coin", color=GREY).scale(header_size),  # Header
-            *[
-                Text(name, color=GREEN if name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain"] else RED).scale(
-                    coin_name_size,
-                )
-                for name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain", "BeerCoin", "BitForex", "Terra Luna"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        train_scores = Group(
-            Text("Accuracy", color=GREY).scale(header_size),  # Header
-            *[
-                Text(
-                    f"{scores[name]}",
-                    color=GREEN if name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain"] else RED,
-                ).scale(score_size)
-                for name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain", "BeerCoin", "BitForex", "Terra Luna"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
+        self.spec_slide("svc")
 
-        # Vertical groups for test set
-        test_coin_names = Group(
-            Text("Coin", color=GREY).scale(header_size),  # Header
-            *[
-                Text(name, color=GREEN if name in ["Cosmos", "Ethereum"] else RED).scale(coin_name_size)
-                for name in ["Cosmos", "Ethereum", "Safe Moon", "FTX Token"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        test_scores = Group(
-            Text("Accuracy", color=GREY).scale(header_size),  # Header
-            *[
-                Text(f"{scores[name]}", color=GREEN if name in ["Cosmos", "Ethereum"] else RED).scale(score_size)
-                for name in ["Cosmos", "Ethereum", "Safe Moon", "FTX Token"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        # Combine train and test groups
-        train_group = Group(
-            Text("Train Set").scale(header_size),
-            Group(train_coin_names, train_scores).arrange(RIGHT, buff=column_buff),
-        ).arrange(DOWN, buff=title_buff)
-
-        test_group = Group(
-            Text("Test Set").scale(header_size),
-            Group(test_coin_names, test_scores).arrange(RIGHT, buff=column_buff),
-        ).arrange(DOWN, buff=title_buff)
-
-        main_group = Group(train_group, test_group).arrange(RIGHT, buff=group_buff)
-
-        self.play(Write(title))
-        self.play(FadeIn(main_group))
-        self.next_slide()
-        self.play(FadeOut(main_group), FadeOut(title))
+    def svc_results_slide(self):
+        # Results slide
+        self.results_slide(
+            self.tr("results.title"),
+            "results/svc.csv",
+            {"Train Set": TRAIN_COINS, "Test Set": TEST_COINS},
+        )
 
+    def gat_slide(self):
         # Graph Attention Network
-        gat_title = Text("Graph Attention Network (GAT)").to_edge(UL)
+        gat_title = CachedText("Graph Attention Network (GAT)").to_edge(UL)
         gat_title.z_index = 1
         gat_graphic = Group(
-            ImageMobject("img/GAT_node.png").scale(0.8),
-            ImageMobject("img/GAT_tsne.png").scale(1),
+            SharedImage("img/GAT_node.png").scale(0.8),
+            SharedImage("img/GAT_tsne.png").scale(1),
         ).arrange(RIGHT)
 
         gat_graphic_attribution = (
             VGroup(
-                Text(
+                CachedText(
                     "Veličković, P., Cucurull, G., Casanova, A., Romero, A., Liò, P., & Bengio, Y. (2018).",
                     color=GREY,
                 ).scale(0.4),
-                Text(
+                CachedText(
                     "Graph Attention Networks (arXiv:1710.10903). arXiv. https://doi.org/10.48550/arXiv.1710.10903",
                     color=GREY,
                 ).scale(0.4),
@@ -544,94 +430,21 @@ class Presentation(Slide):
         self.play(Write(gat_title))
         self.play(FadeIn(gat_graphic_group))
         self.next_slide()
-        self.play(FadeOut(gat_title), FadeOut(gat_graphic_group))
-
-        # Results Slide
-        title_size = 1
-        header_size = 0.7
-        coin_name_size = 0.7
-        score_size = 0.7
-        title_buff = 0.2
-        column_buff = 1
-        group_buff = 2
-
-        title = Text("Metrics").scale(title_size).to_corner(UL)
-
-        scores = {
-            "Avalanche": "0.999...",
-            "Bitcoin": 0.761,
-            "Chainlink": 0.611,
-            "THORChain": 0.633,
-            "BeerCoin": 0.318,
-            "BitForex": 0.482,
-            "Terra Luna": 0.355,
-        }
-
-        # Vertical groups for train set
-        train_coin_names = Group(
-            Text("Coin", color=GREY).scale(header_size),  # Header
-            *[
-                Text(name, color=GREEN if name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain"] else RED).scale(
-                    coin_name_size,
-                )
-                for name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain", "BeerCoin", "BitForex", "Terra Luna"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        train_scores = Group(
-            Text("Accuracy", color=GREY).scale(header_size),  # Header
-            *[
-                Text(
-                    f"{scores[name]}",
-                    color=GREEN if name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain"] else RED,
-                ).scale(score_size)
-                for name in ["Avalanche", "Bitcoin", "Chainlink", "THORChain", "BeerCoin", "BitForex", "Terra Luna"]
-            ],
-        ).arrange(DOWN, buff=title_buff)
-
-        # Combine train and test groups
-        train_group = Group(
-            Text("Train Set").scale(header_size),
-            Group(train_coin_names, train_scores).arrange(RIGHT, buff=column_buff),
-        ).arrange(DOWN, buff=title_buff)
+        self.clear_slide()
 
-        main_group = Group(train_group).arrange(RIGHT, buff=group_buff)
-
-        self.play(Write(title))
-        self.play(FadeIn(main_group))
-        self.next_slide()
-        self.play(FadeOut(main_group), FadeOut(title))
+    def gat_results_slide(self):
+        # Results slide
+        self.results_slide(self.tr("results.title"), "results/gat.json", {"Train Set": TRAIN_COINS})
 
+    def discussion_slide(self):
         # DISCUSSION SLIDE
-        discussion_scale = 0.6
-
-        discussion_title = Text("Diskussion").to_edge(UL)
-
-        results_title = Text("Ergebnisse", color=BLUE).scale(discussion_scale)
-        results_points = VGroup(
-            Text("Keine verlässliche Klassifizierung").scale(discussion_scale),
-            Text("Kommentare allein nicht ausreichend").scale(discussion_scale),
-            Text("Zu wenig Daten kleinerer Coins").scale(discussion_scale),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.5)
-
-        results_group = VGroup(results_title, results_points).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
-
-        improvements_title = Text("Mögliche Verbesserungen", color=GREEN).scale(discussion_scale)
-        improvements_points = VGroup(
-            Text("Embeddings trainieren").scale(discussion_scale),
-            Text("Mehr Coindaten sammeln").scale(discussion_scale),
-            Text("Preis- und Volumendaten hinzufügen").scale(discussion_scale),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.5)
-
-        improvements_group = VGroup(improvements_title, improvements_points).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
-
-        discussion_content = VGroup(results_group, improvements_group).arrange(RIGHT, buff=1)
-
-        self.play(Write(discussion_title))
-        self.play(Write(discussion_content))
-        self.next_slide()
-        self.play(FadeOut(discussion_title), FadeOut(discussion_content))
+        self.spec_slide("discussion")
 
+    def thank_you_slide(self):
         # THANK YOU SLIDE
-        main_text = Text("Vielen Dank!").scale(1.5)
+        main_text = CachedText(self.tr("thank_you.title")).scale(1.5)
         self.play(Write(main_text))
+
+
+class EnglishPresentation(Presentation):
+    locale = "en"